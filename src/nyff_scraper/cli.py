@@ -171,8 +171,11 @@ def run_scraper_pipeline(args) -> int:
 
         # Step 1: Scrape film data
         print("Scraping NYFF film lineup...")
-        films = scraper.scrape_nyff_lineup(
-            args.url, args.backup_url, force_refresh=args.force_refresh_nyff)
+        try:
+            films = scraper.scrape_nyff_lineup(
+                args.url, args.backup_url, force_refresh=args.force_refresh_nyff)
+        finally:
+            scraper.close()
 
         if not films:
             logger.error("No films found at the provided URL")
@@ -184,7 +187,10 @@ def run_scraper_pipeline(args) -> int:
         if not args.only_scrape and not args.skip_imdb:
             print("Enriching with IMDb production company and distributor data...")
             imdb_enricher = IMDbEnricher(cache_dir=args.cache_dir)
-            films = imdb_enricher.enrich_films(films, limit=args.limit)
+            try:
+                films = imdb_enricher.enrich_films(films, limit=args.limit)
+            finally:
+                imdb_enricher.close()
 
             with_imdb = len([f for f in films if f.get('imdb_id')])
             print(f"Found IMDb data for {with_imdb}/{len(films)} films")
@@ -192,9 +198,12 @@ def run_scraper_pipeline(args) -> int:
         # Step 3: Enrich with trailer data (unless skipped)
         if not args.only_scrape and not args.skip_trailers:
             print("Searching for YouTube trailers...")
-            trailer_enricher = TrailerEnricher()
-            films = trailer_enricher.enrich_films(
-                films, search_trailers=True, limit=args.limit)
+            trailer_enricher = TrailerEnricher(cache_dir=args.cache_dir)
+            try:
+                films = trailer_enricher.enrich_films(
+                    films, search_trailers=True, limit=args.limit)
+            finally:
+                trailer_enricher.close()
 
             with_trailers = len([f for f in films if f.get('trailer_url')])
             print(f"Found trailers for {with_trailers}/{len(films)} films")
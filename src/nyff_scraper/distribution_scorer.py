@@ -44,12 +44,42 @@ class DistributionLikelihoodScorer:
             'shorts': -80          # Shorts programs - least likely for distribution
         }
 
-    def extract_festival_section(self, film: Dict) -> str:
+        # Section indicators found in title/description, checked in order.
+        # Each list is compiled once into a single alternation.
+        section_indicators = [
+            ('main slate', [
+                'main slate', 'opening night', 'closing night', 'centerpiece',
+                'gala screening', 'world premiere', 'north american premiere'
+            ]),
+            ('spotlight', [
+                'spotlight', 'special presentation', 'red carpet',
+                'festival highlight', 'special screening'
+            ]),
+            ('currents', [
+                'currents', 'experimental', 'avant-garde', 'art house',
+                'independent', 'emerging filmmaker'
+            ]),
+            ('restoration', [
+                'restoration', 'revival', 'retrospective', 'classic',
+                'newly restored', '4k restoration', 'remastered'
+            ])
+        ]
+        self.section_patterns = [
+            (section, re.compile('|'.join(map(re.escape, indicators))))
+            for section, indicators in section_indicators
+        ]
+
+    def extract_festival_section(
+            self,
+            film: Dict,
+            text_content: Optional[str] = None) -> str:
         """
         Determine the festival section from film data.
 
         Args:
             film: Film dictionary with title, description, and metadata
+            text_content: Lower-cased "title description" text, if the caller
+                has already computed it
 
         Returns:
             Section name (lowercase) or 'unknown' if not determinable
@@ -69,52 +99,14 @@ class DistributionLikelihoodScorer:
             return 'restoration'
 
         # Check title and description for section indicators
-        title = film.get('title') or ''
-        title = title.lower() if title else ''
-        description = film.get('description') or ''
-        description = description.lower() if description else ''
-
-        # Main Slate indicators
-        main_slate_indicators = [
-            'main slate', 'opening night', 'closing night', 'centerpiece',
-            'gala screening', 'world premiere', 'north american premiere'
-        ]
-
-        # Spotlight indicators
-        spotlight_indicators = [
-            'spotlight', 'special presentation', 'red carpet',
-            'festival highlight', 'special screening'
-        ]
-
-        # Currents indicators
-        currents_indicators = [
-            'currents', 'experimental', 'avant-garde', 'art house',
-            'independent', 'emerging filmmaker'
-        ]
+        if text_content is None:
+            title = (film.get('title') or '').lower()
+            description = (film.get('description') or '').lower()
+            text_content = f"{title} {description}"
 
-        # Restoration/Revival indicators
-        restoration_indicators = [
-            'restoration', 'revival', 'retrospective', 'classic',
-            'newly restored', '4k restoration', 'remastered'
-        ]
-
-        text_content = f"{title} {description}"
-
-        for indicator in main_slate_indicators:
-            if indicator in text_content:
-                return 'main slate'
-
-        for indicator in spotlight_indicators:
-            if indicator in text_content:
-                return 'spotlight'
-
-        for indicator in currents_indicators:
-            if indicator in text_content:
-                return 'currents'
-
-        for indicator in restoration_indicators:
-            if indicator in text_content:
-                return 'restoration'
+        for section, pattern in self.section_patterns:
+            if pattern.search(text_content):
+                return section
 
         # Default to unknown if we can't determine
         return 'unknown'
@@ -204,12 +196,16 @@ class DistributionLikelihoodScorer:
         return score
 
     def calculate_distribution_likelihood_score(
-            self, film: Dict) -> Tuple[int, bool, Optional[str]]:
+            self,
+            film: Dict,
+            text_content: Optional[str] = None) -> Tuple[int, bool, Optional[str]]:
         """
         Calculate comprehensive distribution likelihood score.
 
         Args:
             film: Film dictionary with all available metadata
+            text_content: Lower-cased "title description" text, if the caller
+                has already computed it
 
         Returns:
             Tuple of (score, is_distributed_or_likely, theatrical_release_date)
@@ -218,7 +214,7 @@ class DistributionLikelihoodScorer:
         total_score = 0
 
         # 1. Festival section weighting
-        festival_section = self.extract_festival_section(film)
+        festival_section = self.extract_festival_section(film, text_content)
         section_score = self.calculate_festival_section_score(festival_section)
         total_score += section_score
 
@@ -261,18 +257,23 @@ class DistributionLikelihoodScorer:
 
         return final_score, is_likely_distributed, theatrical_release_date
 
-    def enrich_film_with_distribution_score(self, film: Dict) -> Dict:
+    def enrich_film_with_distribution_score(
+            self,
+            film: Dict,
+            text_content: Optional[str] = None) -> Dict:
         """
         Enrich a single film with distribution likelihood scoring.
 
         Args:
             film: Film dictionary to enrich
+            text_content: Lower-cased "title description" text, if the caller
+                has already computed it
 
         Returns:
             Enriched film dictionary with new scoring fields
         """
         score, is_likely, release_date = self.calculate_distribution_likelihood_score(
-            film)
+            film, text_content)
 
         # Add new fields
         film['distribution_likelihood_score'] = score
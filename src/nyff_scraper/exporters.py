@@ -11,6 +11,13 @@ import logging
 from datetime import datetime
 from typing import List, Dict, Optional
 
+# Optional import for faster JSON export
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -66,8 +73,15 @@ class JSONExporter:
                 ]
             }
 
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        if HAS_ORJSON:
+            # Same layout as json.dump below, serialized straight to bytes
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(
+                    output_data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(output_data, f, indent=2, ensure_ascii=False)
 
         rec_msg = f" with {
             len(recommendations)} recommendations" if recommendations else ""
@@ -88,8 +102,12 @@ class JSONExporter:
         import os
 
         # Load existing data
-        with open(existing_file, 'r', encoding='utf-8') as f:
-            existing_data = json.load(f)
+        if HAS_ORJSON:
+            with open(existing_file, 'rb') as f:
+                existing_data = orjson.loads(f.read())
+        else:
+            with open(existing_file, 'r', encoding='utf-8') as f:
+                existing_data = json.load(f)
 
         # Check if this is a file from our scraper
         if not existing_data.get("nyff_scraper_version"):
@@ -6,18 +6,84 @@ Author: Jack Murphy
 
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+from lxml import etree
 import re
+import html
 import time
 import logging
 import json
 from difflib import SequenceMatcher
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Iterator, Optional, Tuple
 from urllib.parse import quote
 from datetime import datetime, timedelta
 
+# Optional import for faster JSON-LD parsing
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
+# Fields set by IMDbEnricher.enrich_films that duplicate listings can share
+IMDB_RESULT_FIELDS = (
+    'production_companies',
+    'distributors',
+    'imdb_id',
+    'theatrical_release_date',
+    'is_festival_debut',
+    'likely_theatrical',
+)
+
+# Connection pool and retry policy for the shared IMDb session
+IMDB_POOL_MAXSIZE = 10
+IMDB_MAX_RETRIES = 3
+IMDB_RETRY_BACKOFF = 1.0
+IMDB_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Title link on an IMDb find page: captures the IMDb ID and the link text.
+# Poster links wrap an <img> rather than text, so they never match.
+SEARCH_RESULT_RE = re.compile(
+    r'href="/title/(tt\d+)/[^"]*"[^>]*>([^<]{1,240})</a>')
+
+# Any link to a title page, used to check that SEARCH_RESULT_RE saw every
+# result (a title wrapped in extra markup is missed by it)
+TITLE_HREF_RE = re.compile(r'href="/title/(tt\d+)/')
+
+# Characters after a result's title link searched for its release year; the
+# window also ends where the next result's title link starts
+SEARCH_RESULT_CONTEXT_CHARS = 512
+
+# Markup stripped from a result's context before looking for the year, so
+# IDs in hrefs and attributes never count (a tag cut off by the end of the
+# window is dropped too)
+HTML_TAG_RE = re.compile(r'<[^>]*(?:>|$)')
+
+# Elements wrapping a single advanced search result (modern list items,
+# legacy lister items), whose text holds the result's year and director
+ADVANCED_RESULT_CONTAINER_SELECTOR = 'li, article, div.lister-item'
+
+# Characters fed to the streaming JSON-LD parser at a time
+JSONLD_FEED_CHUNK_SIZE = 65536
+
+# Smart quotes and dashes mapped to their ASCII equivalents for searching
+TITLE_TRANSLATION = str.maketrans({
+    '\u2018': "'",
+    '\u2019': "'",
+    '\u201c': '"',
+    '\u201d': '"',
+    '\u2014': '-',
+    '\u2013': '-',
+})
+
+# Runs of whitespace or characters that break IMDb search. Apostrophes,
+# hyphens, and common punctuation are kept for better matching.
+TITLE_CLEAN_RE = re.compile(r"[^\w'\-.:!?]+")
+
 
 class IMDbEnricher:
     """Enricher for adding IMDb production company and distributor data."""
@@ -30,47 +96,87 @@ class IMDbEnricher:
         """
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Connection': 'keep-alive',
         })
+        # Every request goes to www.imdb.com, so one keep-alive pool serves
+        # the whole run and transient errors are retried with backoff
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=IMDB_POOL_MAXSIZE,
+            max_retries=Retry(
+                total=IMDB_MAX_RETRIES,
+                backoff_factor=IMDB_RETRY_BACKOFF,
+                status_forcelist=IMDB_RETRY_STATUSES))
+        self.session.mount('https://', adapter)
         self.cache_dir = cache_dir
 
+        # Per-run memoization so repeated lookups skip fetching and parsing
+        self._search_cache = {}
+        self._credits_cache = {}
+        self._date_cache = {}
+        self._jsonld_cache = {}
+
+    def close(self) -> None:
+        """Close the HTTP session and its pooled connections."""
+        self.session.close()
+
+    @staticmethod
+    def _normalize_title(title: str) -> str:
+        """Normalize title for search by handling special characters."""
+        return TITLE_CLEAN_RE.sub(' ', title.translate(TITLE_TRANSLATION)).strip()
+
+    @staticmethod
+    def _normalize_batch(titles: List[str]) -> List[str]:
+        """Normalize a batch of titles for search.
+
+        Args:
+            titles: Titles to normalize
+
+        Returns:
+            Normalized titles in the same order
+        """
+        return [IMDbEnricher._normalize_title(title) for title in titles]
+
     def search_imdb(
             self,
             film_title: str,
             year: str = "2025",
-            director: str = "") -> Optional[str]:
+            director: str = "",
+            clean_title: Optional[str] = None) -> Optional[str]:
         """Search IMDb for film and return IMDb ID.
 
         Args:
             film_title: Title of the film to search for
             year: Year to include in search (defaults to 2025)
             director: Director name to include for more accurate search
+            clean_title: Already normalized title, computed if not given
 
         Returns:
             IMDb ID (e.g., "tt1234567") or None if not found
         """
-        def normalize_title(title: str) -> str:
-            """Normalize title for search by handling special characters."""
-            # Replace smart quotes and similar characters
-            title = title.replace(''', "'").replace(''', "'")
-            title = title.replace('"', '"').replace('"', '"')
-            title = title.replace('—', '-').replace('–', '-')
-            # Keep apostrophes, hyphens, and common punctuation for better matching
-            # Only remove truly problematic characters
-            title = re.sub(r'[^\w\s\'\-\.\:\!\?]', ' ', title)
-            # Collapse multiple spaces
-            title = re.sub(r'\s+', ' ', title).strip()
-            return title
-
-        # Normalize title for search
-        clean_title = normalize_title(film_title)
+        key = (film_title, year, director)
+        if key not in self._search_cache:
+            if clean_title is None:
+                clean_title = self._normalize_title(film_title)
+            self._search_cache[key] = self._search_imdb(
+                film_title, year, director, clean_title)
+        return self._search_cache[key]
+
+    def _search_imdb(
+            self,
+            film_title: str,
+            year: str,
+            director: str,
+            clean_title: str) -> Optional[str]:
+        """Uncached implementation of search_imdb."""
 
         # Strategy 1: Use find search (most reliable for NYFF films)
         # This provides better results than advanced search for festival films
         search_attempts = []
 
         if director:
-            clean_director = normalize_title(director)
+            clean_director = self._normalize_title(director)
             search_attempts.append(f"{clean_title} {clean_director} {year}")
 
         search_attempts.append(f"{clean_title} {year}")
@@ -86,69 +192,50 @@ class IMDbEnricher:
             if not content:
                 continue
 
-            soup = BeautifulSoup(content, 'html.parser')
-
-            # Look for search results with improved selectors - most specific first
-            result_selectors = [
-                'a.ipc-metadata-list-summary-item__t[href*="/title/tt"]',  # Most specific - modern IMDb with title links
-                'a.ipc-metadata-list-summary-item__t',  # Modern IMDb layout  
-                '.find-title-result a[href*="/title/tt"]',  # Find results page title links
-                'a[href*="/title/tt"]',  # Generic IMDb title links
-                '.findResult .result_text a',  # Legacy layout
-                '.titleResult a',  # Legacy layout
-                '.find-section .findResult h3.findResult-text a',  # Legacy layout
-                '.cli-title'  # Alternative layout
-            ]
-
-            for selector in result_selectors:
-                links = soup.select(selector)
-                logger.debug(f"Selector '{selector}' found {len(links)} links")
-                for link in links:
-                    href = link.get('href', '')
-                    logger.debug(f"Checking link href: {href}")
-                    match = re.search(r'/title/(tt\d+)/', href)
-                    if match:
-                        imdb_id = match.group(1)
-                        link_title = link.get_text(strip=True)
-                        logger.debug(f"Found IMDb ID {imdb_id} for title '{link_title}'")
-
-                        validation_result = self._validate_search_result(
-                                link, film_title, year, director)
-                        
-                        logger.debug(f"Validation result for {imdb_id}: {validation_result}")
-                        
-                        if validation_result == "valid":
-                            # If we have a director to validate, check it on the main page
-                            if director and director.strip():
-                                found_director = self.get_director_from_imdb_page(imdb_id)
-                                if found_director and self.validate_director_match(found_director, director):
-                                    logger.info(
-                                        f"Found IMDb ID for '{film_title}' (find search attempt {attempt_num}, director validated): {imdb_id}")
-                                    return imdb_id
-                                elif found_director:
-                                    logger.warning(
-                                        f"Director mismatch for '{film_title}' (IMDb: '{found_director}' vs expected: '{director}'), continuing search")
-                                    continue
-                                else:
-                                    logger.warning(
-                                        f"Could not find director for '{film_title}' on IMDb page, accepting anyway: {imdb_id}")
-                                    return imdb_id
-                            else:
-                                # No director to validate, title + year match is sufficient
-                                logger.info(
-                                    f"Found IMDb ID for '{film_title}' (find search attempt {attempt_num}): {imdb_id}")
-                                return imdb_id
-                        # If validation_result == "invalid", continue to next result
+            for imdb_id, validation_result in self._find_search_candidates(
+                    content, film_title, year, director):
+                logger.debug(
+                    "Validation result for %s: %s", imdb_id, validation_result)
+
+                if validation_result == "valid":
+                    # If we have a director to validate, check it on the main page
+                    if director and director.strip():
+                        found_director = self.get_director_from_imdb_page(imdb_id)
+                        if found_director and self.validate_director_match(found_director, director):
+                            logger.info(
+                                "Found IMDb ID for '%s' (find search attempt %d, director validated): %s",
+                                film_title, attempt_num, imdb_id)
+                            return imdb_id
+                        elif found_director:
+                            logger.warning(
+                                "Director mismatch for '%s' (IMDb: '%s' vs expected: '%s'), continuing search",
+                                film_title, found_director, director)
+                            continue
+                        else:
+                            logger.warning(
+                                "Could not find director for '%s' on IMDb page, accepting anyway: %s",
+                                film_title, imdb_id)
+                            return imdb_id
+                    else:
+                        # No director to validate, title + year match is sufficient
+                        logger.info(
+                            "Found IMDb ID for '%s' (find search attempt %d): %s",
+                            film_title, attempt_num, imdb_id)
+                        return imdb_id
+                # If validation_result == "invalid", continue to next result
 
             if attempt_num == 1 and director:
                 logger.warning(
-                    f"No IMDb ID found for '{film_title}' with director '{director}', trying without director")
+                    "No IMDb ID found for '%s' with director '%s', trying without director",
+                    film_title, director)
             elif attempt_num == 2:
                 logger.warning(
-                    f"No IMDb ID found for '{film_title}' with year, trying title only")
+                    "No IMDb ID found for '%s' with year, trying title only",
+                    film_title)
 
         # Strategy 2: Fall back to advanced search if find search fails
-        logger.info(f"Find search failed, trying advanced search for '{film_title}'")
+        logger.info(
+            "Find search failed, trying advanced search for '%s'", film_title)
         advanced_search_url = f"https://www.imdb.com/search/title/?title={
             quote(clean_title)}&release_date={year}-01-01,{year}-12-31"
         underscored_film_title = re.sub(r'[^\w]', '_', film_title)
@@ -167,41 +254,150 @@ class IMDbEnricher:
                 '.lister-item-header a'
             ]
 
-            for selector in advanced_selectors:
-                links = soup.select(selector)
-                for link in links:
-                    href = link.get('href', '')
-                    match = re.search(r'/title/(tt\d+)/', href)
-                    if match:
-                        imdb_id = match.group(1)
-                        link_text = link.get_text(strip=True)
-
-                        # Validate result by checking if title is reasonably similar
-                        if self._is_title_match(link_text, film_title) and self._validate_advanced_result(link, film_title, year, director):
-                            # If we have a director to validate, check it on the main page  
-                            if director and director.strip():
-                                found_director = self.get_director_from_imdb_page(imdb_id)
-                                if found_director and self.validate_director_match(found_director, director):
-                                    logger.info(
-                                        f"Found IMDb ID for '{film_title}' via advanced search (director validated): {imdb_id}")
-                                    return imdb_id
-                                elif found_director:
-                                    logger.debug(
-                                        f"Director mismatch in advanced search for '{film_title}' (IMDb: '{found_director}' vs expected: '{director}'), continuing")
-                                    continue
-                                else:
-                                    logger.info(
-                                        f"Found IMDb ID for '{film_title}' via advanced search (no director found): {imdb_id}")
-                                    return imdb_id
-                            else:
-                                logger.info(
-                                    f"Found IMDb ID for '{film_title}' via advanced search: {imdb_id}")
-                                return imdb_id
+            results = self._map_result_containers(
+                soup, ', '.join(advanced_selectors))
+
+            for imdb_id, (link, container) in results.items():
+                link_text = link.get_text(strip=True)
+
+                # Validate result by checking if title is reasonably similar
+                if self._is_title_match(link_text, film_title) and self._validate_advanced_result(
+                        container.get_text(), film_title, year, director):
+                    # If we have a director to validate, check it on the main page  
+                    if director and director.strip():
+                        found_director = self.get_director_from_imdb_page(imdb_id)
+                        if found_director and self.validate_director_match(found_director, director):
+                            logger.info(
+                                "Found IMDb ID for '%s' via advanced search (director validated): %s",
+                                film_title, imdb_id)
+                            return imdb_id
+                        elif found_director:
+                            logger.debug(
+                                "Director mismatch in advanced search for '%s' (IMDb: '%s' vs expected: '%s'), continuing",
+                                film_title, found_director, director)
+                            continue
+                        else:
+                            logger.info(
+                                "Found IMDb ID for '%s' via advanced search (no director found): %s",
+                                film_title, imdb_id)
+                            return imdb_id
+                    else:
+                        logger.info(
+                            "Found IMDb ID for '%s' via advanced search: %s",
+                            film_title, imdb_id)
+                        return imdb_id
 
         logger.warning(
-            f"No IMDb ID found for '{film_title}' after all search attempts")
+            "No IMDb ID found for '%s' after all search attempts", film_title)
         return None
 
+    def _find_search_candidates(
+            self,
+            content: str,
+            film_title: str,
+            year: str,
+            director: str) -> Iterator[Tuple[str, str]]:
+        """Yield (imdb_id, validation_result) for each result on a find page.
+
+        Result links are scanned straight out of the raw HTML with a regex
+        tailored to IMDb's markup. The page is parsed with BeautifulSoup
+        instead when some title on the page has no plain-text link the scan
+        can read (e.g. a title wrapped in extra markup, or a layout change).
+
+        Args:
+            content: HTML of an IMDb find page
+            film_title: Title being searched for
+            year: Year expected near the result
+            director: Director being searched for
+
+        Yields:
+            Tuples of IMDb ID and "valid" or "invalid"
+        """
+        matches = list(SEARCH_RESULT_RE.finditer(content))
+        matched_ids = {match.group(1) for match in matches}
+        if not matches or not matched_ids.issuperset(
+                TITLE_HREF_RE.findall(content)):
+            yield from self._find_search_candidates_soup(
+                content, film_title, year, director)
+            return
+
+        year_re = re.compile(r'\b' + re.escape(year) + r'\b') if year else None
+        for i, match in enumerate(matches):
+            imdb_id = match.group(1)
+            link_title = html.unescape(match.group(2)).strip()
+            logger.debug("Found IMDb ID %s for title '%s'", imdb_id, link_title)
+
+            if not self._is_title_match(link_title, film_title):
+                logger.debug(
+                    "Title mismatch: '%s' vs '%s'", link_title, film_title)
+                yield imdb_id, "invalid"
+                continue
+
+            # The year sits in the metadata list right after the title link,
+            # before the next result starts
+            context_end = match.end() + SEARCH_RESULT_CONTEXT_CHARS
+            if i + 1 < len(matches):
+                context_end = min(context_end, matches[i + 1].start())
+            context = html.unescape(
+                HTML_TAG_RE.sub(' ', content[match.end():context_end]))
+            if year_re is None or year_re.search(context):
+                yield imdb_id, "valid"
+            else:
+                logger.debug(
+                    "Year mismatch: looking for '%s' in '%s'", year, context)
+                yield imdb_id, "invalid"
+
+    def _find_search_candidates_soup(
+            self,
+            content: str,
+            film_title: str,
+            year: str,
+            director: str) -> Iterator[Tuple[str, str]]:
+        """Yield find page results by parsing the page with BeautifulSoup.
+
+        Fallback for _find_search_candidates when the raw HTML scan misses
+        some of the page's title links.
+
+        Args:
+            content: HTML of an IMDb find page
+            film_title: Title being searched for
+            year: Year expected near the result
+            director: Director being searched for
+
+        Yields:
+            Tuples of IMDb ID and "valid" or "invalid"
+        """
+        soup = BeautifulSoup(content, 'html.parser')
+
+        # Look for search results with improved selectors - most specific first
+        result_selectors = [
+            'a.ipc-metadata-list-summary-item__t[href*="/title/tt"]',  # Most specific - modern IMDb with title links
+            'a.ipc-metadata-list-summary-item__t',  # Modern IMDb layout
+            '.find-title-result a[href*="/title/tt"]',  # Find results page title links
+            'a[href*="/title/tt"]',  # Generic IMDb title links
+            '.findResult .result_text a',  # Legacy layout
+            '.titleResult a',  # Legacy layout
+            '.find-section .findResult h3.findResult-text a',  # Legacy layout
+            '.cli-title'  # Alternative layout
+        ]
+
+        for selector in result_selectors:
+            links = soup.select(selector)
+            logger.debug("Selector '%s' found %d links", selector, len(links))
+            for link in links:
+                href = link.get('href', '')
+                logger.debug("Checking link href: %s", href)
+                match = re.search(r'/title/(tt\d+)/', href)
+                if match:
+                    imdb_id = match.group(1)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Found IMDb ID %s for title '%s'",
+                            imdb_id, link.get_text(strip=True))
+
+                    yield imdb_id, self._validate_search_result(
+                        link, film_title, year, director)
+
     def _is_title_match(
             self,
             found_title: str,
@@ -231,24 +427,57 @@ class IMDbEnricher:
                 r'[^\w\s]', ' ', expected_title.lower().strip())
             return expected_clean in found_clean or found_clean in expected_clean
 
+    @staticmethod
+    def _map_result_containers(soup, link_selector: str) -> Dict[str, Tuple]:
+        """Map each result's IMDb ID to its title link and container.
+
+        Result containers are selected once, in document order, and each
+        contributes the first title link inside it. When containers nest,
+        the innermost one around a result wins. Container text is left for
+        the caller to extract, so results failing the title check cost
+        nothing more.
+
+        Args:
+            soup: Parsed advanced search page
+            link_selector: CSS selector for a result's title link
+
+        Returns:
+            Dictionary of IMDb ID to (title link, container), in page order
+        """
+        results = {}
+        for container in soup.select(ADVANCED_RESULT_CONTAINER_SELECTOR):
+            link = container.select_one(link_selector)
+            if link is None:
+                continue
+            match = re.search(r'/title/(tt\d+)/', link.get('href', ''))
+            if match:
+                results[match.group(1)] = (link, container)
+        return results
+
     def _validate_advanced_result(
             self,
-            link_element,
+            container_text: Optional[str],
             expected_title: str,
             expected_year: str,
             expected_director: str = "") -> bool:
-        """Validate advanced search results."""
-        try:
-            # Get the parent container which usually has year and director info
-            parent = link_element.find_parent()
-            while parent and parent.name not in [
-                    'li', 'div', 'article'] and parent.find_parent():
-                parent = parent.find_parent()
+        """Validate advanced search results.
+
+        Args:
+            container_text: Text of the result's container, which usually
+                has year and director info
+            expected_title: Title being searched for
+            expected_year: Year expected in the result
+            expected_director: Director expected in the result
 
-            if not parent:
-                return True  # If we can't find parent context, assume it's okay
+        Returns:
+            True if the result's context matches, False if it doesn't or
+            there is no context to check
+        """
+        try:
+            if container_text is None:
+                return False  # Without the result's context nothing can be checked
 
-            parent_text = parent.get_text()
+            parent_text = container_text
 
             # Check for year in the parent text
             year_pattern = r'\b' + re.escape(expected_year) + r'\b'
@@ -284,7 +513,8 @@ class IMDbEnricher:
             
             # Check title similarity first
             if not self._is_title_match(link_title, expected_title):
-                logger.debug(f"Title mismatch: '{link_title}' vs '{expected_title}'")
+                logger.debug(
+                    "Title mismatch: '%s' vs '%s'", link_title, expected_title)
                 return "invalid"
             
             # Get the result text and surrounding context
@@ -298,11 +528,13 @@ class IMDbEnricher:
                 # Title + year match is sufficient - we'll validate director on the main page
                 return "valid"
             else:
-                logger.debug(f"Year mismatch: looking for '{expected_year}' in '{parent_text}'")
+                logger.debug(
+                    "Year mismatch: looking for '%s' in '%s'",
+                    expected_year, parent_text)
                 return "invalid"
                 
         except Exception as e:
-            logger.debug(f"Validation error: {e}")
+            logger.debug("Validation error: %s", e)
             return "invalid"
 
     def get_theatrical_release_date(self, imdb_id: str) -> Optional[str]:
@@ -314,6 +546,13 @@ class IMDbEnricher:
         Returns:
             Theatrical release date string or None if not found
         """
+        if imdb_id not in self._date_cache:
+            self._date_cache[imdb_id] = self._get_theatrical_release_date(
+                imdb_id)
+        return self._date_cache[imdb_id]
+
+    def _get_theatrical_release_date(self, imdb_id: str) -> Optional[str]:
+        """Uncached implementation of get_theatrical_release_date."""
         url = f"https://www.imdb.com/title/{imdb_id}/"
         filename = f"imdb_main_{imdb_id}.html"
         content = self.get_cached_or_fetch(url, filename)
@@ -321,60 +560,151 @@ class IMDbEnricher:
         if not content:
             return None
 
+        # Strategy 1: JSON-LD structured data is authoritative when present
+        release_date = self._get_title_jsonld(
+            imdb_id, content).get('datePublished')
+        if release_date:
+            return release_date
+
         soup = BeautifulSoup(content, 'html.parser')
 
-        # Look for release date information
-        release_selectors = [
-            'li[data-testid="title-pc-principal-credit"]:contains("Release date")',
-            '.titlereference-overview-section li:contains("Release")',
-            '[data-testid="title-details-releasedate"]',
-            'span:contains("Release date") + span',
-            'h4:contains("Release Date") + ul li']
+        # Strategy 2: The release date row in the details section
+        details_item = soup.find(
+            'li', attrs={'data-testid': 'title-details-releasedate'})
+        if details_item:
+            release_date = self._match_release_date(
+                details_item.get_text(' ', strip=True))
+            if release_date:
+                return release_date
+
+        # Strategy 3: Any list item mentioning the release date. Filtering
+        # on text directly replaces the old :contains() selectors, which
+        # SoupSieve rejects.
+        for li in soup.find_all('li'):
+            text = li.get_text(' ', strip=True)
+            if 'Release date' in text or 'Release Date' in text:
+                release_date = self._match_release_date(text)
+                if release_date:
+                    return release_date
+
+        logger.debug("No theatrical release date found for %s", imdb_id)
+        return None
+
+    def _match_release_date(self, text: str) -> Optional[str]:
+        """Find a release date like "15 March 2024" or "March 15, 2024" in text.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            Matched date string or None if no date is present
+        """
+        # Look for date patterns like "15 March 2024"
+        date_match = re.search(
+            r'(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4})',
+            text,
+            re.I)
+        if date_match:
+            return date_match.group(1)
+        # Alternative format: Month Day, Year
+        date_match = re.search(
+            r'((?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},\s+\d{4})',
+            text,
+            re.I)
+        if date_match:
+            return date_match.group(1)
+        return None
+
+    def _load_json(self, text: str):
+        """Parse a JSON string, using orjson when it is installed.
+
+        Args:
+            text: JSON text to parse
+
+        Returns:
+            Parsed JSON value
+
+        Raises:
+            ValueError: If the text is not valid JSON
+        """
+        if HAS_ORJSON:
+            return orjson.loads(text)
+        return json.loads(text)
+
+    def _get_title_jsonld(self, imdb_id: str, content: str) -> Dict:
+        """Get a title's JSON-LD, parsing its main page at most once per run.
+
+        The release date, director and company lookups all read the same
+        block, so it is memoized per IMDb ID. Callers must not mutate it.
+
+        Args:
+            imdb_id: IMDb ID (e.g., "tt1234567")
+            content: Raw HTML of the title's main page
+
+        Returns:
+            The title's JSON-LD object, or an empty dict if none parse
+        """
+        if imdb_id not in self._jsonld_cache:
+            self._jsonld_cache[imdb_id] = self._extract_jsonld(content)
+        return self._jsonld_cache[imdb_id]
+
+    def _extract_jsonld(self, content: str) -> Dict:
+        """Extract the title's JSON-LD structured data from an IMDb page.
+
+        The page is fed to a pull parser in chunks and parsing stops at the
+        first usable JSON-LD block. IMDb emits it in <head>, so the body of
+        the page is never parsed.
+
+        Args:
+            content: Raw HTML of an IMDb title page
+
+        Returns:
+            The first JSON-LD object found, or an empty dict if none parse
+        """
+        parser = etree.HTMLPullParser(events=('end',), tag='script')
+
+        for start in range(0, len(content), JSONLD_FEED_CHUNK_SIZE):
+            parser.feed(content[start:start + JSONLD_FEED_CHUNK_SIZE])
+            data = self._first_jsonld_object(parser)
+            if data:
+                return data
+
+        try:
+            parser.close()
+        except etree.XMLSyntaxError:
+            # Raised for empty documents
+            return {}
+        return self._first_jsonld_object(parser)
+
+    def _first_jsonld_object(self, parser) -> Dict:
+        """Drain pending script events and return the first JSON-LD object.
+
+        Args:
+            parser: lxml HTMLPullParser filtered to <script> end events
+
+        Returns:
+            The first JSON-LD object among the pending events, or an empty dict
+        """
+        for _, script in parser.read_events():
+            if script.get('type') != 'application/ld+json':
+                script.clear()
+                continue
 
-        for selector in release_selectors:
             try:
-                elements = soup.select(selector)
-                for element in elements:
-                    text = element.get_text(strip=True)
-                    # Look for date patterns like "March 15, 2024", "15 March
-                    # 2024", etc.
-                    date_match = re.search(
-                        r'(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4})',
-                        text,
-                        re.I)
-                    if date_match:
-                        return date_match.group(1)
-                    # Alternative format: Month Day, Year
-                    date_match = re.search(
-                        r'((?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},\s+\d{4})',
-                        text,
-                        re.I)
-                    if date_match:
-                        return date_match.group(1)
-            except Exception:
+                data = self._load_json(script.text or '')
+            except (ValueError, TypeError):
                 continue
+            finally:
+                script.clear()
 
-        # Fallback: look for any date in the general structure
-        try:
-            # Look for structured data or meta tags
-            script_tags = soup.find_all('script', type='application/ld+json')
-            for script in script_tags:
-                try:
-                    data = json.loads(script.string)
-                    if isinstance(data, dict) and 'datePublished' in data:
-                        return data['datePublished']
-                    elif isinstance(data, list):
-                        for item in data:
-                            if isinstance(
-                                    item, dict) and 'datePublished' in item:
-                                return item['datePublished']
-                except (json.JSONDecodeError, AttributeError):
-                    continue
-        except Exception:
-            pass
+            if isinstance(data, dict):
+                return data
+            if isinstance(data, list):
+                for item in data:
+                    if isinstance(item, dict):
+                        return item
 
-        logger.debug(f"No theatrical release date found for {imdb_id}")
-        return None
+        return {}
 
     def get_director_from_imdb_page(self, imdb_id: str) -> Optional[str]:
         """Get director from IMDb main page.
@@ -427,38 +757,22 @@ class IMDbEnricher:
 
         # Try JSON-LD structured data
         if not directors:
-            try:
-                script_tags = soup.find_all('script', type='application/ld+json')
-                for script in script_tags:
-                    try:
-                        data = json.loads(script.string)
-                        if isinstance(data, dict) and 'director' in data:
-                            director_data = data['director']
-                            if isinstance(director_data, list):
-                                directors.extend([d.get('name', '') for d in director_data if isinstance(d, dict) and 'name' in d])
-                            elif isinstance(director_data, dict) and 'name' in director_data:
-                                directors.append(director_data['name'])
-                        elif isinstance(data, list):
-                            for item in data:
-                                if isinstance(item, dict) and 'director' in item:
-                                    director_data = item['director']
-                                    if isinstance(director_data, list):
-                                        directors.extend([d.get('name', '') for d in director_data if isinstance(d, dict) and 'name' in d])
-                                    elif isinstance(director_data, dict) and 'name' in director_data:
-                                        directors.append(director_data['name'])
-                    except (json.JSONDecodeError, AttributeError, KeyError):
-                        continue
-            except Exception:
-                pass
+            director_data = self._get_title_jsonld(
+                imdb_id, content).get('director')
+            if isinstance(director_data, list):
+                directors.extend([d.get('name', '') for d in director_data if isinstance(d, dict) and 'name' in d])
+            elif isinstance(director_data, dict) and 'name' in director_data:
+                directors.append(director_data['name'])
 
         # Clean up and return
         directors = [d for d in directors if d and d.strip()]
         if directors:
             director_str = ', '.join(directors)
-            logger.debug(f"Found director(s) for {imdb_id}: {director_str}")
+            logger.debug(
+                "Found director(s) for %s: %s", imdb_id, director_str)
             return director_str
         
-        logger.debug(f"No director found for {imdb_id}")
+        logger.debug("No director found for %s", imdb_id)
         return None
 
     def validate_director_match(self, found_director: str, expected_director: str) -> bool:
@@ -528,7 +842,9 @@ class IMDbEnricher:
         earliest_date = min(dates)
         latest_date = max(dates)
         
-        logger.info(f"Detected festival date range: {earliest_date.strftime('%Y-%m-%d')} to {latest_date.strftime('%Y-%m-%d')}")
+        logger.info(
+            "Detected festival date range: %s to %s",
+            earliest_date.date(), latest_date.date())
         return earliest_date, latest_date
 
     def _parse_date_from_string(self, date_str: str) -> Optional[datetime]:
@@ -607,7 +923,9 @@ class IMDbEnricher:
         is_festival_date = fest_start.date() <= parsed_date.date() <= fest_end.date()
         
         if is_festival_date:
-            logger.info(f"Date '{date_str}' falls within festival window ({fest_start.strftime('%Y-%m-%d')} to {fest_end.strftime('%Y-%m-%d')}) - treating as festival premiere, not theatrical release")
+            logger.info(
+                "Date '%s' falls within festival window (%s to %s) - treating as festival premiere, not theatrical release",
+                date_str, fest_start.date(), fest_end.date())
         
         return is_festival_date
 
@@ -721,7 +1039,8 @@ class IMDbEnricher:
                 pass
 
         logger.debug(
-            f"Extracted from {imdb_id}: country='{country}', runtime='{runtime}'")
+            "Extracted from %s: country='%s', runtime='%s'",
+            imdb_id, country, runtime)
         return country, runtime
 
     def _parse_iso_duration(self, duration: str) -> str:
@@ -757,12 +1076,37 @@ class IMDbEnricher:
         Returns:
             Dictionary with 'production_companies' and 'distributors' lists
         """
+        if imdb_id not in self._credits_cache:
+            self._credits_cache[imdb_id] = self._get_company_credits(imdb_id)
+        credits = self._credits_cache[imdb_id]
+        # Hand out copies so callers can't mutate the cached lists
+        return {key: list(value) for key, value in credits.items()}
+
+    def _get_company_credits(self, imdb_id: str) -> Dict[str, List[str]]:
+        """Uncached implementation of get_company_credits."""
+        # Production companies are listed as Organization creators in the
+        # main page's JSON-LD, which is already cached from the other lookups.
+        # Distributors only appear on the company credits page.
+        jsonld_companies = []
+        main_content = self.get_cached_or_fetch(
+            f"https://www.imdb.com/title/{imdb_id}/",
+            f"imdb_main_{imdb_id}.html")
+        if main_content:
+            creators = self._get_title_jsonld(
+                imdb_id, main_content).get('creator', [])
+            if isinstance(creators, dict):
+                creators = [creators]
+            jsonld_companies = [
+                c['name'] for c in creators
+                if isinstance(c, dict) and c.get('@type') == 'Organization'
+                and c.get('name')]
+
         url = f"https://www.imdb.com/title/{imdb_id}/companycredits/"
         filename = f"imdb_credits_{imdb_id}.html"
         content = self.get_cached_or_fetch(url, filename)
 
         if not content:
-            return {"production_companies": [], "distributors": []}
+            return {"production_companies": jsonld_companies, "distributors": []}
 
         soup = BeautifulSoup(content, 'html.parser')
 
@@ -812,15 +1156,19 @@ class IMDbEnricher:
                     # Default to production if unclear
                     production_companies.append(company_name)
 
-        # Clean up duplicates and empty strings
+        # JSON-LD companies come first; the credits page only adds the
+        # companies the structured data leaves out
+        production_companies = jsonld_companies + production_companies
+
+        # Clean up duplicates and empty strings, keeping the listed order.
+        # Names are already stripped by get_text(strip=True).
         production_companies = list(
-            set([pc for pc in production_companies if pc.strip()]))
-        distributors = list(set([d for d in distributors if d.strip()]))
+            {pc: None for pc in production_companies if pc})
+        distributors = list({d: None for d in distributors if d})
 
         logger.info(
-            f"Found {
-                len(production_companies)} production companies and {
-                len(distributors)} distributors for {imdb_id}")
+            "Found %d production companies and %d distributors for %s",
+            len(production_companies), len(distributors), imdb_id)
 
         return {
             "production_companies": production_companies,
@@ -913,7 +1261,8 @@ class IMDbEnricher:
         
         if all_dates:
             earliest = min(all_dates)
-            logger.info(f"Festival start date determined as: {earliest.strftime('%Y-%m-%d')}")
+            logger.info(
+                "Festival start date determined as: %s", earliest.date())
             return earliest
         
         logger.warning("No festival dates found in any films")
@@ -946,9 +1295,15 @@ class IMDbEnricher:
         is_debut = days_difference <= 21
         
         if is_debut:
-            logger.info(f"'{film.get('title')}' is likely a festival debut - Festival: {festival_start_date.strftime('%Y-%m-%d')}, IMDb: {imdb_date.strftime('%Y-%m-%d')} ({days_difference} days apart)")
+            logger.info(
+                "'%s' is likely a festival debut - Festival: %s, IMDb: %s (%d days apart)",
+                film.get('title'), festival_start_date.date(),
+                imdb_date.date(), days_difference)
         else:
-            logger.debug(f"'{film.get('title')}' is not a festival debut - Festival: {festival_start_date.strftime('%Y-%m-%d')}, IMDb: {imdb_date.strftime('%Y-%m-%d')} ({days_difference} days apart)")
+            logger.debug(
+                "'%s' is not a festival debut - Festival: %s, IMDb: %s (%d days apart)",
+                film.get('title'), festival_start_date.date(),
+                imdb_date.date(), days_difference)
             
         return is_debut
 
@@ -968,23 +1323,29 @@ class IMDbEnricher:
         if limit:
             films = films[:limit]
             logger.info(
-                f"Processing limited set of {
-                    len(films)} films for testing")
+                "Processing limited set of %d films for testing", len(films))
         
         # Calculate festival start date once for all debut checks
         festival_start_date = self._get_festival_start_date(films)
 
+        # First enriched film for each (title, year, director) key
+        enriched_by_key = {}
+
+        # Normalize every title up front; used for dedup keys and searching
+        normalized_titles = self._normalize_batch(
+            [film['title'] for film in films])
+
         for i, film in enumerate(films):
             logger.info(
-                f"Processing film {i + 1}/{len(films)}: {film['title']}")
+                "Processing film %d/%d: %s", i + 1, len(films), film['title'])
 
             # Check if we should skip IMDb lookup
             should_skip, skip_reason = self.should_skip_imdb_lookup(film)
 
             if should_skip:
                 logger.info(
-                    f"Skipping IMDb lookup for '{
-                        film['title']}': {skip_reason}")
+                    "Skipping IMDb lookup for '%s': %s",
+                    film['title'], skip_reason)
                 film['production_companies'] = []
                 film['distributors'] = []
                 film['imdb_id'] = None
@@ -996,10 +1357,34 @@ class IMDbEnricher:
             # Extract year from film screenings
             screening_year = self._extract_year_from_film(film)
             
-            # Search IMDb with director for better accuracy
             director = film.get('director', '')
+
+            # Duplicate listings of the same film reuse the first lookup
+            clean_title = normalized_titles[i]
+            dedup_key = (
+                clean_title.lower(),
+                screening_year,
+                (director or '').strip().lower())
+            original = enriched_by_key.get(dedup_key)
+            if original is not None:
+                logger.info(
+                    "Reusing IMDb data for duplicate listing '%s'",
+                    film['title'])
+                for field in IMDB_RESULT_FIELDS:
+                    if field in original:
+                        value = original[field]
+                        film[field] = list(value) if isinstance(
+                            value, list) else value
+                for field in ('country', 'runtime'):
+                    if not film.get(field):
+                        film[field] = original.get(field)
+                processed_films.append(film)
+                continue
+            enriched_by_key[dedup_key] = film
+
+            # Search IMDb with director for better accuracy
             imdb_id = self.search_imdb(
-                film['title'], screening_year, director)
+                film['title'], screening_year, director, clean_title)
 
             if imdb_id:
                 # Get company credits
@@ -1040,7 +1425,9 @@ class IMDbEnricher:
                 if self._is_festival_date(theatrical_release_date, films):
                     # This is just a festival premiere, not a real theatrical release
                     has_valid_release_date = False
-                    logger.info(f"'{film['title']}' release date '{theatrical_release_date}' is festival premiere - not counting as theatrical release")
+                    logger.info(
+                        "'%s' release date '%s' is festival premiere - not counting as theatrical release",
+                        film['title'], theatrical_release_date)
                 else:
                     has_valid_release_date = True
 
@@ -1056,13 +1443,16 @@ class IMDbEnricher:
             # Log the reasoning for debugging
             if has_valid_release_date:
                 logger.info(
-                    f"'{film['title']}' marked as likely_theatrical=True due to confirmed release date: {theatrical_release_date}")
+                    "'%s' marked as likely_theatrical=True due to confirmed release date: %s",
+                    film['title'], theatrical_release_date)
             elif production_count > 2 or distributor_count >= 1:
                 logger.info(
-                    f"'{film['title']}' marked as likely_theatrical=True due to {production_count} production companies and {distributor_count} distributors")
+                    "'%s' marked as likely_theatrical=True due to %d production companies and %d distributors",
+                    film['title'], production_count, distributor_count)
             else:
                 logger.info(
-                    f"'{film['title']}' marked as likely_theatrical=False - no release date and limited production backing")
+                    "'%s' marked as likely_theatrical=False - no release date and limited production backing",
+                    film['title'])
 
             processed_films.append(film)
 
@@ -1081,11 +1471,11 @@ class IMDbEnricher:
         cache_path = os.path.join(self.cache_dir, filename)
 
         if os.path.exists(cache_path):
-            logger.info(f"Loading from cache: {filename}")
+            logger.info("Loading from cache: %s", filename)
             with open(cache_path, 'r', encoding='utf-8') as f:
                 return f.read()
 
-        logger.info(f"Fetching: {url}")
+        logger.info("Fetching: %s", url)
         try:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
@@ -1100,5 +1490,5 @@ class IMDbEnricher:
             return content
 
         except requests.RequestException as e:
-            logger.error(f"Error fetching {url}: {e}")
+            logger.error("Error fetching %s: %s", url, e)
             return ""
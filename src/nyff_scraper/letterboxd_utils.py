@@ -9,17 +9,61 @@ for NYFF films based on similarity scoring with the user's watched films.
 Author: Jack Murphy
 """
 
+import os
+import json
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from lxml import etree, html
 import re
 import time
 import logging
-from typing import List, Dict, Set, Optional, Tuple
+import threading
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, FrozenSet, Optional, Tuple
 from collections import Counter
 from urllib.parse import urljoin
 
 logger = logging.getLogger(__name__)
 
+# Profile pages fetched at once after the first (kept small so a short list
+# stops at its first empty page without wasted requests), and the spacing
+# kept between requests that actually go out to Letterboxd (cache hits are
+# never delayed)
+LETTERBOXD_FETCH_WORKERS = 2
+LETTERBOXD_REQUEST_INTERVAL = 2.0
+
+# Cached Letterboxd pages older than this are revalidated with a conditional
+# GET, and the oldest tenth (by last access) is evicted once the cached pages
+# grow past the size limit
+LETTERBOXD_CACHE_MAX_AGE_MINUTES = 24 * 60
+LETTERBOXD_CACHE_MAX_BYTES = 50 * 1024 * 1024
+LETTERBOXD_CACHE_EVICT_FRACTION = 0.1
+
+# Film poster components on a Letterboxd films page carry all their data in
+# data-* attributes, so they are matched directly on the lxml tree
+FILM_COMPONENT_XPATH = etree.XPath(
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' react-component ')]"
+    "[@data-item-name]")
+
+# Words are runs of word characters; punctuation and whitespace split them
+WORD_RE = re.compile(r'\w+')
+
+# Trailing "(Year)" on a Letterboxd item name
+ITEM_YEAR_RE = re.compile(r'\((\d{4})\)$')
+
+# Distinct texts whose normalized word sets are kept in memory
+NORMALIZE_CACHE_SIZE = 4096
+
+# Common stopwords for text normalization
+STOPWORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from',
+    'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the',
+    'to', 'was', 'with', 'but', 'not', 'or', 'his', 'her', 'their',
+    'this', 'these', 'they', 'we', 'you', 'your', 'all', 'any', 'can',
+    'had', 'have', 'him', 'will', 'would'
+})
+
 
 class LetterboxdScraper:
     """Scraper for Letterboxd user profiles and film data."""
@@ -34,73 +78,191 @@ class LetterboxdScraper:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=LETTERBOXD_FETCH_WORKERS)
+        self.session.mount('https://', adapter)
         self.cache_dir = cache_dir
-
-        # Common stopwords for text normalization
-        self.stopwords = {
-            'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from',
-            'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the',
-            'to', 'was', 'with', 'but', 'not', 'or', 'his', 'her', 'their',
-            'this', 'these', 'they', 'we', 'you', 'your', 'all', 'any', 'can',
-            'had', 'have', 'him', 'will', 'would'
-        }
-
-    def get_cached_or_fetch(self, url: str, filename: str) -> str:
+        self.stopwords = STOPWORDS
+
+        # Shared across fetch threads to space out network requests
+        self._rate_lock = threading.Lock()
+        self._next_request_time = 0.0
+
+    def _wait_for_request_slot(self) -> None:
+        """Block until this thread may send a request to Letterboxd."""
+        with self._rate_lock:
+            now = time.monotonic()
+            start = max(now, self._next_request_time)
+            self._next_request_time = start + LETTERBOXD_REQUEST_INTERVAL
+        if start > now:
+            time.sleep(start - now)
+
+    def get_cached_or_fetch(
+            self,
+            url: str,
+            filename: str,
+            max_age_minutes: Optional[int] = LETTERBOXD_CACHE_MAX_AGE_MINUTES) -> str:
         """Get content from cache or fetch from URL.
 
         Args:
             url: URL to fetch
             filename: Cache filename
+            max_age_minutes: Maximum age of cache file in minutes. If None, no age limit is applied
 
         Returns:
             HTML content as string
         """
-        import os
+        return self._get_cached_or_fetch_bytes(
+            url, filename, max_age_minutes).decode('utf-8', errors='replace')
+
+    def _get_cached_or_fetch_bytes(
+            self,
+            url: str,
+            filename: str,
+            max_age_minutes: Optional[int] = LETTERBOXD_CACHE_MAX_AGE_MINUTES) -> bytes:
+        """Get raw page bytes from cache or fetch from URL.
+
+        Pages are cached exactly as served, so they can be handed to lxml
+        without a decode/re-encode round trip. Cache entries older than
+        max_age_minutes are revalidated using the ETag/Last-Modified
+        validators saved in a sidecar file; a 304 reply just marks the
+        cached copy as fresh again.
+
+        Args:
+            url: URL to fetch
+            filename: Cache filename
+            max_age_minutes: Maximum age of cache file in minutes. If None, no age limit is applied
+
+        Returns:
+            Raw HTML bytes, empty if the page could not be fetched
+        """
         cache_path = os.path.join(self.cache_dir, filename)
+        meta_path = cache_path + '.meta.json'
+        cached_content = None
+
+        # Another fetch thread may evict the page at any moment, so a file
+        # that disappears is just a cache miss
+        try:
+            with open(cache_path, 'rb') as f:
+                cached_content = f.read()
+                cache_mtime = os.fstat(f.fileno()).st_mtime
+        except FileNotFoundError:
+            pass
+
+        if cached_content is not None:
+            file_age_minutes = (time.time() - cache_mtime) / 60
+            if max_age_minutes is None or file_age_minutes <= max_age_minutes:
+                logger.info(f"Loading from cache: {filename}")
+                return cached_content
+
+            logger.info(
+                f"Cache file {filename} is {file_age_minutes:.1f} minutes old (max: {max_age_minutes}), revalidating")
 
-        if os.path.exists(cache_path):
-            logger.info(f"Loading from cache: {filename}")
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                return f.read()
+        headers = {}
+        if cached_content is not None:
+            validators = self._load_cache_meta(meta_path)
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('last_modified'):
+                headers['If-Modified-Since'] = validators['last_modified']
 
+        self._wait_for_request_slot()
         logger.info(f"Fetching: {url}")
         try:
-            response = self.session.get(url, timeout=30)
+            response = self.session.get(url, headers=headers, timeout=30)
+            if response.status_code == 304 and cached_content is not None:
+                logger.info(f"Not modified, keeping cache: {filename}")
+                try:
+                    os.utime(cache_path)
+                except FileNotFoundError:
+                    pass
+                return cached_content
+
             response.raise_for_status()
-            content = response.text
+            content = response.content
 
             # Cache the content
             os.makedirs(self.cache_dir, exist_ok=True)
-            with open(cache_path, 'w', encoding='utf-8') as f:
+            with open(cache_path, 'wb') as f:
                 f.write(content)
+            with open(meta_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified')
+                }, f)
 
-            # Be nice to servers
-            time.sleep(2)
+            self._evict_cache()
             return content
 
         except requests.RequestException as e:
             logger.error(f"Error fetching {url}: {e}")
-            return ""
+            if cached_content is not None:
+                logger.warning(f"Using stale cache for {filename}")
+                return cached_content
+            return b""
+
+    @staticmethod
+    def _load_cache_meta(meta_path: str) -> Dict:
+        """Load the saved HTTP validators for a cache entry, if any."""
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
 
-    def normalize_text(self, text: str) -> Set[str]:
+    def _evict_cache(self) -> None:
+        """Evict least recently accessed Letterboxd pages over the size limit."""
+        try:
+            entries = []
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if (entry.name.startswith('letterboxd_')
+                            and entry.name.endswith('.html') and entry.is_file()):
+                        try:
+                            stat = entry.stat()
+                        except FileNotFoundError:
+                            # Evicted by another fetch thread meanwhile
+                            continue
+                        entries.append((stat.st_atime, stat.st_size, entry.path))
+        except OSError as e:
+            logger.debug(f"Could not scan cache directory: {e}")
+            return
+
+        if sum(size for _, size, _ in entries) <= LETTERBOXD_CACHE_MAX_BYTES:
+            return
+
+        entries.sort()
+        evict_count = max(1, int(len(entries) * LETTERBOXD_CACHE_EVICT_FRACTION))
+        for _, _, path in entries[:evict_count]:
+            for stale_path in (path, path + '.meta.json'):
+                try:
+                    os.remove(stale_path)
+                except OSError:
+                    pass
+        logger.info(f"Evicted {evict_count} Letterboxd pages from cache")
+
+    @staticmethod
+    @functools.lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+    def normalize_text(text: str) -> FrozenSet[str]:
         """Normalize text by lowercasing, removing punctuation, and filtering stopwords.
 
+        Results are memoized, so the same description is only tokenized once
+        across films, runs and users.
+
         Args:
             text: Input text to normalize
 
         Returns:
-            Set of normalized words
+            Frozen set of normalized words
         """
         if not text:
-            return set()
-
-        # Convert to lowercase and remove punctuation
-        text = re.sub(r'[^\w\s]', ' ', text.lower())
+            return frozenset()
 
-        # Split into words and remove stopwords
-        words = text.split()
-        normalized_words = {
-            word for word in words if word and word not in self.stopwords}
+        # Convert to lowercase, split on punctuation/whitespace and remove
+        # stopwords
+        words = WORD_RE.findall(text.lower())
+        normalized_words = frozenset(
+            word for word in words if word not in STOPWORDS)
 
         return normalized_words
 
@@ -125,25 +287,44 @@ class LetterboxdScraper:
             'ratings': {}  # film_title -> rating (if available)
         }
 
-        # Scrape multiple pages of the user's films
-        for page in range(1, max_pages + 1):
-            url = f"https://letterboxd.com/{username}/films/page/{page}/"
-            filename = f"letterboxd_{username}_films_page_{page}.html"
-
-            content = self.get_cached_or_fetch(url, filename)
-            if not content:
-                continue
-
-            soup = BeautifulSoup(content, 'html.parser')
-
-            # Extract films from this page
-            page_films = self._extract_films_from_page(soup)
-            if not page_films:
-                logger.info(f"No more films found at page {page}, stopping")
-                break
-
-            user_data['films'].extend(page_films)
-            logger.info(f"Found {len(page_films)} films on page {page}")
+        # Page 1 is fetched alone, since most lists end there; later pages
+        # are fetched in small concurrent batches and processed in order, so
+        # the first page without films ends the scrape
+        def fetch_page(page: int) -> bytes:
+            return self._get_cached_or_fetch_bytes(
+                f"https://letterboxd.com/{username}/films/page/{page}/",
+                f"letterboxd_{username}_films_page_{page}.html")
+
+        with ThreadPoolExecutor(max_workers=LETTERBOXD_FETCH_WORKERS) as executor:
+            batch = range(1, min(2, max_pages + 1))
+            while batch:
+                finished = False
+                for page, content in zip(batch, executor.map(fetch_page, batch)):
+                    if not content:
+                        continue
+
+                    try:
+                        tree = html.fromstring(content)
+                    except etree.ParserError as e:
+                        # Empty or whitespace-only bodies can't be parsed
+                        logger.warning(f"Could not parse page {page}: {e}")
+                        continue
+
+                    # Extract films from this page
+                    page_films = self._extract_films_from_page(tree)
+                    if not page_films:
+                        logger.info(f"No more films found at page {page}, stopping")
+                        finished = True
+                        break
+
+                    user_data['films'].extend(page_films)
+                    logger.info(f"Found {len(page_films)} films on page {page}")
+
+                if finished:
+                    break
+                batch = range(
+                    batch.stop,
+                    min(batch.stop + LETTERBOXD_FETCH_WORKERS, max_pages + 1))
 
         # Process collected films to extract patterns
         self._process_user_films(user_data)
@@ -155,11 +336,11 @@ class LetterboxdScraper:
 
         return user_data
 
-    def _extract_films_from_page(self, soup: BeautifulSoup) -> List[Dict]:
+    def _extract_films_from_page(self, tree: html.HtmlElement) -> List[Dict]:
         """Extract film data from a Letterboxd page.
 
         Args:
-            soup: BeautifulSoup object of the page
+            tree: Parsed lxml tree of the page
 
         Returns:
             List of film dictionaries
@@ -167,7 +348,7 @@ class LetterboxdScraper:
         films = []
 
         # Look for React components with film data
-        react_components = soup.select('.react-component[data-item-name]')
+        react_components = FILM_COMPONENT_XPATH(tree)
 
         for component in react_components:
             try:
@@ -179,7 +360,7 @@ class LetterboxdScraper:
                     continue
 
                 # Parse title and year from "Title (Year)" format
-                year_match = re.search(r'\((\d{4})\)$', item_name)
+                year_match = ITEM_YEAR_RE.search(item_name)
                 if year_match:
                     film_data['year'] = year_match.group(1)
                     film_data['title'] = item_name.replace(
@@ -222,6 +403,7 @@ class LetterboxdScraper:
         Args:
             user_data: User data dictionary to update
         """
+        keywords = set(user_data['keywords'])
         for film in user_data['films']:
             # For detailed film metadata, we'd need to scrape individual film pages
             # For now, we'll work with basic title and year data
@@ -235,7 +417,9 @@ class LetterboxdScraper:
             # Extract keywords from titles (basic approach)
             if film.get('title'):
                 title_keywords = self.normalize_text(film['title'])
-                user_data['keywords'].update(title_keywords)
+                keywords.update(title_keywords)
+
+        user_data['keywords'] = frozenset(keywords)
 
 
 class LetterboxdRecommender:
@@ -266,8 +450,15 @@ class LetterboxdRecommender:
 
         scored_films = []
 
-        for film in nyff_films:
-            score, reasoning = self._score_film(film, user_data)
+        # Normalize descriptions and lower-case rated titles once per batch
+        film_keywords = [
+            LetterboxdScraper.normalize_text(film.get('description', ''))
+            for film in nyff_films]
+        user_index = self._build_user_index(user_data)
+
+        for film, keywords in zip(nyff_films, film_keywords):
+            score, reasoning = self._score_film(
+                film, user_data, keywords, user_index)
             if score > 0:  # Only include films with positive scores
                 scored_films.append({
                     'film': film,
@@ -286,16 +477,54 @@ class LetterboxdRecommender:
 
         return recommendations
 
-    def _score_film(self, film: Dict, user_data: Dict) -> Tuple[int, str]:
+    @staticmethod
+    def _build_user_index(user_data: Dict) -> Dict:
+        """Precompute the parts of the user data shared by every film's score.
+
+        Args:
+            user_data: Letterboxd user data
+
+        Returns:
+            Dictionary with the user's keywords, lower-cased rated titles, an
+            inverted index of title words to positions in that list, and a
+            per-director cache of matching ratings
+        """
+        ratings = [(title.lower(), rating)
+                   for title, rating in (user_data.get('ratings') or {}).items()]
+
+        ratings_by_word = {}
+        for position, (title, _) in enumerate(ratings):
+            for word in set(WORD_RE.findall(title)):
+                ratings_by_word.setdefault(word, []).append(position)
+
+        return {
+            'keywords': frozenset(user_data['keywords']),
+            'ratings': ratings,
+            'ratings_by_word': ratings_by_word,
+            'director_ratings': {}
+        }
+
+    def _score_film(
+            self,
+            film: Dict,
+            user_data: Dict,
+            film_keywords: Optional[FrozenSet[str]] = None,
+            user_index: Optional[Dict] = None) -> Tuple[int, str]:
         """Score a single film based on user preferences.
 
         Args:
             film: NYFF film dictionary
             user_data: Letterboxd user data
+            film_keywords: Normalized description keywords, computed here if
+                not given
+            user_index: Result of _build_user_index, computed here if not given
 
         Returns:
             Tuple of (score, reasoning)
         """
+        if user_index is None:
+            user_index = self._build_user_index(user_data)
+
         score = 0
         reasoning_parts = []
 
@@ -316,11 +545,11 @@ class LetterboxdRecommender:
                 f"Country {film_country} ({count} films watched)")
 
         # Keyword overlap from description
-        film_description = film.get('description', '')
-        if film_description:
-            scraper = LetterboxdScraper()  # For normalize_text method
-            film_keywords = scraper.normalize_text(film_description)
-            keyword_overlap = len(film_keywords & user_data['keywords'])
+        if film_keywords is None:
+            film_keywords = LetterboxdScraper.normalize_text(
+                film.get('description', ''))
+        if film_keywords:
+            keyword_overlap = len(film_keywords & user_index['keywords'])
 
             if keyword_overlap >= 5:
                 score += 2
@@ -338,13 +567,25 @@ class LetterboxdRecommender:
 
         # Star ratings bonus (optional)
         # If user has rated films by this director highly, add bonus
-        if film_director and user_data.get('ratings'):
-            director_ratings = []
-            for film_title, rating in user_data['ratings'].items():
+        if film_director and user_index['ratings']:
+            director_key = film_director.lower()
+            director_ratings = user_index['director_ratings'].get(director_key)
+            if director_ratings is None:
                 # This is a simplified check - in practice you'd need more
-                # sophisticated matching
-                if film_director.lower() in film_title.lower():
-                    director_ratings.append(rating)
+                # sophisticated matching. Only titles containing every word
+                # of the director's name are candidates.
+                candidates = None
+                for word in WORD_RE.findall(director_key):
+                    positions = set(
+                        user_index['ratings_by_word'].get(word, ()))
+                    candidates = positions if candidates is None else candidates & positions
+                    if not candidates:
+                        break
+                director_ratings = [
+                    user_index['ratings'][position][1]
+                    for position in sorted(candidates or ())
+                    if director_key in user_index['ratings'][position][0]]
+                user_index['director_ratings'][director_key] = director_ratings
 
             if director_ratings:
                 avg_rating = sum(director_ratings) / len(director_ratings)
@@ -6,12 +6,93 @@ Author: Jack Murphy
 
 import re
 import logging
+from collections import Counter
 from typing import List, Dict, Optional
 from .distribution_scorer import DistributionLikelihoodScorer
 
 logger = logging.getLogger(__name__)
 
 
+def _compile_indicators(indicators: List[str], flags: int = 0) -> re.Pattern:
+    """Compile a list of literal indicators into a single alternation regex.
+
+    Args:
+        indicators: Lowercase phrases to look for
+        flags: Regex flags, e.g. re.IGNORECASE for text that isn't lowered
+
+    Returns:
+        Compiled pattern matching any of the phrases
+    """
+    return re.compile('|'.join(map(re.escape, indicators)), flags)
+
+
+SHORTS_TITLE_RE = _compile_indicators([
+    'shorts', 'short films', 'short program', 'anthology',
+    'collection', 'omnibus', 'portmanteau'
+])
+
+SHORTS_DESCRIPTION_RE = _compile_indicators([
+    'short films', 'shorts program', 'anthology', 'collection of',
+    'various directors', 'multiple filmmakers', 'several shorts'
+])
+
+SHORTS_RUNTIME_RE = _compile_indicators(['shorts', 'films', 'segments'])
+
+RESTORATION_RE = _compile_indicators([
+    'restoration', '4k restoration', 'new restoration', 'restored',
+    'remastered', 'revival', 'classic', 'retrospective',
+    'newly restored', 'digital restoration'
+])
+
+# Showtime notes are matched case-insensitively rather than lowered first
+INTRO_QNA_NOTE_RE = _compile_indicators([
+    'q&a', 'intro', 'introduction', 'panel', 'discussion'
+], re.IGNORECASE)
+
+INTRO_QNA_DESCRIPTION_RE = _compile_indicators([
+    'q&a',
+    'introduction',
+    'panel',
+    'discussion',
+    'filmmaker in attendance',
+    'followed by',
+    'with director',
+    'with cast',
+    'film scholar',
+    'critic',
+    'moderated',
+    'special guest'])
+
+SPOTLIGHT_RE = _compile_indicators([
+    'spotlight', 'opening night', 'closing night', 'gala',
+    'centerpiece', 'special screening', 'world premiere',
+    'red carpet', 'festival highlight'
+])
+
+# Director credits naming more than one filmmaker (common in shorts programs)
+MULTIPLE_DIRECTOR_RES = [
+    re.compile(r'(?:and|&|\+|,)\s*[A-Z]'),  # "Director A and Director B"
+    re.compile(r',\s*[A-Z][a-z]+\s+[A-Z][a-z]+'),  # Multiple full names
+]
+
+# Boolean fields tallied in the enrichment summary
+SUMMARY_FLAGS = (
+    'is_short_program', 'is_restoration', 'has_intro_or_qna',
+    'is_likely_to_be_distributed'
+)
+
+EMOJI_RE = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"  # emoticons
+    "\U0001F300-\U0001F5FF"  # symbols & pictographs
+    "\U0001F680-\U0001F6FF"  # transport & map symbols
+    "\U0001F1E0-\U0001F1FF"  # flags (iOS)
+    "\U00002702-\U000027B0"
+    "\U000024C2-\U0001F251"
+    "]+", flags=re.UNICODE
+)
+
+
 class MetadataEnricher:
     """Enricher for adding metadata classification fields."""
 
@@ -19,6 +100,53 @@ class MetadataEnricher:
         """Initialize the metadata enricher."""
         self.distribution_scorer = DistributionLikelihoodScorer()
 
+    @staticmethod
+    def _lowered_fields(film: Dict) -> Dict[str, str]:
+        """Lower-case the text fields the classifiers look at.
+
+        Args:
+            film: Film dictionary
+
+        Returns:
+            Dictionary of lower-cased title, description, director and
+            runtime, plus the combined title and description text
+        """
+        title = (film.get('title') or '').lower()
+        description = (film.get('description') or '').lower()
+        return {
+            'title': title,
+            'description': description,
+            'director': (film.get('director') or '').lower(),
+            'runtime': (film.get('runtime') or '').lower(),
+            'text_content': f"{title} {description}"
+        }
+
+    def _classify(
+            self,
+            film: Dict,
+            fields: Optional[Dict[str, str]] = None) -> Dict:
+        """Compute all classification fields for a film in one pass.
+
+        Args:
+            film: Film dictionary
+            fields: Result of _lowered_fields, computed here if not given
+
+        Returns:
+            Dictionary with is_short_program, is_restoration,
+            has_intro_or_qna and category
+        """
+        if fields is None:
+            fields = self._lowered_fields(film)
+        flags = {
+            'is_short_program': self._is_short_program(fields),
+            'is_restoration': self._is_restoration(fields, film.get('year', '')),
+            'has_intro_or_qna': self._has_intro_or_qna(
+                fields, film.get('nyff_showtimes', []))
+        }
+        flags['category'] = self._categorize(
+            fields, flags['is_short_program'], flags['is_restoration'])
+        return flags
+
     def is_short_program(self, film: Dict) -> bool:
         """Detect if a film listing is a shorts program.
 
@@ -28,53 +156,27 @@ class MetadataEnricher:
         Returns:
             True if this appears to be a shorts program
         """
-        title = film.get('title') or ''
-        title = title.lower() if title else ''
-        description = film.get('description') or ''
-        description = description.lower() if description else ''
-        director = film.get('director') or ''
-        director = director.lower() if director else ''
-
-        # Check title for shorts indicators
-        shorts_title_indicators = [
-            'shorts', 'short films', 'short program', 'anthology',
-            'collection', 'omnibus', 'portmanteau'
-        ]
-
-        # Check for multiple directors (common in shorts programs)
-        multiple_director_patterns = [
-            r'(?:and|&|\+|,)\s*[A-Z]',  # "Director A and Director B"
-            r',\s*[A-Z][a-z]+\s+[A-Z][a-z]+',  # Multiple full names
-        ]
+        return self._is_short_program(self._lowered_fields(film))
 
+    @staticmethod
+    def _is_short_program(fields: Dict[str, str]) -> bool:
+        """Shorts program check on pre-lowered fields."""
         # Title-based detection
-        if any(indicator in title for indicator in shorts_title_indicators):
+        if SHORTS_TITLE_RE.search(fields['title']):
             return True
 
         # Description-based detection
-        desc_indicators = [
-            'short films', 'shorts program', 'anthology', 'collection of',
-            'various directors', 'multiple filmmakers', 'several shorts'
-        ]
-        if any(indicator in description for indicator in desc_indicators):
+        if SHORTS_DESCRIPTION_RE.search(fields['description']):
             return True
 
         # Multiple directors pattern
-        if any(re.search(pattern, director)
-               for pattern in multiple_director_patterns):
+        if any(pattern.search(fields['director'])
+               for pattern in MULTIPLE_DIRECTOR_RES):
             return True
 
-        # Check for runtime patterns suggesting shorts
-        runtime = film.get('runtime') or ''
-        runtime = runtime.lower() if runtime else ''
-        if runtime:
-            # Look for patterns like "90 minutes (5 shorts)" or similar
-            if any(
-                word in runtime for word in [
-                    'shorts',
-                    'films',
-                    'segments']):
-                return True
+        # Look for runtime patterns like "90 minutes (5 shorts)" or similar
+        if SHORTS_RUNTIME_RE.search(fields['runtime']):
+            return True
 
         return False
 
@@ -87,22 +189,14 @@ class MetadataEnricher:
         Returns:
             True if this appears to be a restoration or revival
         """
-        title = film.get('title') or ''
-        title = title.lower() if title else ''
-        description = film.get('description') or ''
-        description = description.lower() if description else ''
-        year = film.get('year', '')
-
-        # Check for restoration indicators in title/description
-        restoration_indicators = [
-            'restoration', '4k restoration', 'new restoration', 'restored',
-            'remastered', 'revival', 'classic', 'retrospective',
-            'newly restored', 'digital restoration'
-        ]
-
-        # Check title and description
-        text_content = f"{title} {description}"
-        if any(indicator in text_content for indicator in restoration_indicators):
+        return self._is_restoration(
+            self._lowered_fields(film), film.get('year', ''))
+
+    @staticmethod
+    def _is_restoration(fields: Dict[str, str], year) -> bool:
+        """Restoration check on pre-lowered fields."""
+        # Check title and description for restoration indicators
+        if RESTORATION_RE.search(fields['text_content']):
             return True
 
         # Check if year suggests it's a classic (before 2020 for NYFF 2025)
@@ -141,40 +235,21 @@ class MetadataEnricher:
         Returns:
             True if there's an introduction, Q&A, or panel
         """
+        return self._has_intro_or_qna(
+            self._lowered_fields(film), film.get('nyff_showtimes', []))
+
+    @staticmethod
+    def _has_intro_or_qna(fields: Dict[str, str], showtimes: List[Dict]) -> bool:
+        """Intro/Q&A check on pre-lowered fields."""
         # Check showtime notes
-        showtimes = film.get('nyff_showtimes', [])
         for showtime in showtimes:
             notes = showtime.get('notes', [])
             for note in notes:
-                if note is not None:
-                    note_lower = note.lower()
-                    if any(
-                        keyword in note_lower for keyword in [
-                            'q&a',
-                            'intro',
-                            'introduction',
-                            'panel',
-                            'discussion']):
-                        return True
+                if note is not None and INTRO_QNA_NOTE_RE.search(note):
+                    return True
 
         # Check description for mentions
-        description = film.get('description') or ''
-        description = description.lower() if description else ''
-        intro_qna_indicators = [
-            'q&a',
-            'introduction',
-            'panel',
-            'discussion',
-            'filmmaker in attendance',
-            'followed by',
-            'with director',
-            'with cast',
-            'film scholar',
-            'critic',
-            'moderated',
-            'special guest']
-
-        if any(indicator in description for indicator in intro_qna_indicators):
+        if INTRO_QNA_DESCRIPTION_RE.search(fields['description']):
             return True
 
         return False
@@ -188,41 +263,31 @@ class MetadataEnricher:
         Returns:
             Category string: "shorts", "restoration", "spotlight", "feature", "other"
         """
-        title = film.get('title') or ''
-        title = title.lower() if title else ''
-        description = film.get('description') or ''
-        description = description.lower() if description else ''
-
+        return self._categorize(
+            self._lowered_fields(film),
+            film.get('is_short_program', False),
+            film.get('is_restoration', False))
+
+    @staticmethod
+    def _categorize(
+            fields: Dict[str, str],
+            is_short_program: bool,
+            is_restoration: bool) -> str:
+        """Category check on pre-lowered fields and computed flags."""
         # Check if it's shorts program
-        if film.get('is_short_program', False):
+        if is_short_program:
             return 'shorts'
 
         # Check if it's restoration
-        if film.get('is_restoration', False):
+        if is_restoration:
             return 'restoration'
 
         # Check for spotlight indicators
-        spotlight_indicators = [
-            'spotlight', 'opening night', 'closing night', 'gala',
-            'centerpiece', 'special screening', 'world premiere',
-            'red carpet', 'festival highlight'
-        ]
-
-        text_content = f"{title} {description}"
-        if any(indicator in text_content for indicator in spotlight_indicators):
+        if SPOTLIGHT_RE.search(fields['text_content']):
             return 'spotlight'
 
-        # Default to feature for narrative films
-        runtime = film.get('runtime', '')
-        if runtime:
-            # Try to extract minutes
-            runtime_match = re.search(r'(\d+)', runtime)
-            if runtime_match:
-                minutes = int(runtime_match.group(1))
-                if minutes >= 40:  # Feature length
-                    return 'feature'
-
-        # If we can't determine, default to feature
+        # Everything else is a feature; feature-length runtimes and
+        # undetermined ones both land here, so the runtime isn't parsed
         return 'feature'
 
     def clean_notes(self, notes: Optional[str]) -> str:
@@ -237,19 +302,9 @@ class MetadataEnricher:
         if not notes:
             return ""
 
-        # Remove emojis using regex
-        emoji_pattern = re.compile(
-            "["
-            "\U0001F600-\U0001F64F"  # emoticons
-            "\U0001F300-\U0001F5FF"  # symbols & pictographs
-            "\U0001F680-\U0001F6FF"  # transport & map symbols
-            "\U0001F1E0-\U0001F1FF"  # flags (iOS)
-            "\U00002702-\U000027B0"
-            "\U000024C2-\U0001F251"
-            "]+", flags=re.UNICODE
-        )
-
-        cleaned = emoji_pattern.sub('', notes)
+        # Remove emojis using regex; every emoji range is outside ASCII, so
+        # plain ASCII notes skip the regex entirely
+        cleaned = notes if notes.isascii() else EMOJI_RE.sub('', notes)
 
         # Clean up extra whitespace
         cleaned = ' '.join(cleaned.split())
@@ -266,6 +321,7 @@ class MetadataEnricher:
             List of enriched film dictionaries
         """
         enriched_films = []
+        flag_counts = Counter()
 
         logger.info(f"Adding metadata fields to {len(films)} films")
 
@@ -278,17 +334,14 @@ class MetadataEnricher:
                         'title',
                         'Unknown')}")
 
-            # Add new boolean fields
-            film['is_short_program'] = self.is_short_program(film)
-            film['is_restoration'] = self.is_restoration(film)
-            film['has_intro_or_qna'] = self.has_intro_or_qna(film)
+            # Add boolean fields and category in one pass over the text
+            fields = self._lowered_fields(film)
+            film.update(self._classify(film, fields))
 
-            # Add category field
-            film['category'] = self.categorize_film(film)
-
-            # Use the new comprehensive distribution likelihood scoring
+            # Use the new comprehensive distribution likelihood scoring,
+            # reusing the lower-cased text
             enriched_film = self.distribution_scorer.enrich_film_with_distribution_score(
-                film)
+                film, text_content=fields['text_content'])
 
             # Clean up existing notes
             if 'notes' in enriched_film and enriched_film['notes'] is not None:
@@ -311,21 +364,15 @@ class MetadataEnricher:
                     notes_parts) if notes_parts else None
 
             enriched_films.append(enriched_film)
+            flag_counts.update(
+                flag for flag in SUMMARY_FLAGS if enriched_film.get(flag))
 
         # Log summary
-        short_programs = len(
-            [f for f in enriched_films if f.get('is_short_program')])
-        restorations = len(
-            [f for f in enriched_films if f.get('is_restoration')])
-        with_intro_qna = len(
-            [f for f in enriched_films if f.get('has_intro_or_qna')])
-        likely_distributed = len(
-            [f for f in enriched_films if f.get('is_likely_to_be_distributed')])
-
         logger.info(f"Metadata enrichment complete:")
-        logger.info(f"  Short programs: {short_programs}")
-        logger.info(f"  Restorations: {restorations}")
-        logger.info(f"  With intro/Q&A: {with_intro_qna}")
-        logger.info(f"  Likely distributed: {likely_distributed}")
+        logger.info(f"  Short programs: {flag_counts['is_short_program']}")
+        logger.info(f"  Restorations: {flag_counts['is_restoration']}")
+        logger.info(f"  With intro/Q&A: {flag_counts['has_intro_or_qna']}")
+        logger.info(
+            f"  Likely distributed: {flag_counts['is_likely_to_be_distributed']}")
 
         return enriched_films
@@ -5,26 +5,23 @@ Author: Jack Murphy
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from lxml import etree, html
 import os
+import gzip
+import zlib
+import json
 import time
 import re
 import logging
 import random
-import gzip
-import io
-import zlib
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Tuple
 from urllib.parse import urljoin
+from email.utils import formatdate
 from .exceptions import NetworkError, CacheError, ParsingError, DataExtractionError
 
-# Optional import for brotli support
-try:
-    import brotli
-    HAS_BROTLI = True
-except ImportError:
-    HAS_BROTLI = False
-
 logger = logging.getLogger(__name__)
 
 # Constants
@@ -35,6 +32,88 @@ DEFAULT_REQUEST_TIMEOUT = 30
 DEFAULT_REQUEST_DELAY = 2
 METADATA_YEAR_LENGTH = 4
 
+# Lineup pages are cached gzipped; a low level keeps writes cheap while
+# still shrinking the HTML several times over
+CACHE_COMPRESS_LEVEL = 3
+
+# Keep-alive pool for the lineup page and its archive.org backups
+# (retries are handled by get_cached_or_fetch itself)
+SCRAPER_POOL_CONNECTIONS = 4
+SCRAPER_POOL_MAXSIZE = 10
+
+# Lineup pages are decoded to str before parsing, so the parser is told the
+# encoding of the re-encoded bytes rather than trusting the page's <meta>
+LINEUP_HTML_PARSER = html.HTMLParser(encoding='utf-8')
+
+
+def _has_classes(*classes: str) -> str:
+    """Build an XPath predicate matching elements that carry every class."""
+    return ' and '.join(
+        f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')"
+        for cls in classes)
+
+
+# XPath queries for the lineup page, compiled once rather than per film
+FILM_CONTAINER_XPATH = etree.XPath(
+    f"//div[{_has_classes('py-8', 'lg:py-10', 'border-b', 'border-border')}]")
+TITLE_LINK_XPATH = etree.XPath(".//a[contains(@href, '/nyff2025/films/')]")
+TITLE_DIV_XPATH = etree.XPath(".//div")
+PROSE_XPATH = etree.XPath(
+    f".//p[ancestor::*[{_has_classes('typography', 'prose')}]]")
+FLEX_XPATH = etree.XPath(f".//div[{_has_classes('flex', 'flex-wrap')}]")
+METADATA_XPATH = etree.XPath(".//p[@data-typography-mobile='body-xs']")
+SHOWTIME_SECTION_XPATH = etree.XPath(
+    f".//div[{_has_classes('flex', 'flex-col', 'gap-2', 'mt-4')}]")
+DATE_SECTION_XPATH = etree.XPath(
+    f".//div[{_has_classes('flex', 'flex-col', 'gap-2', 'border-t', 'border-border', 'pt-2')}]")
+DATE_ELEM_XPATH = etree.XPath(".//p[@data-typography-mobile='d-eyebrow-sm']")
+BUTTON_XPATH = etree.XPath(".//button")
+LINETHROUGH_XPATH = etree.XPath(f".//*[{_has_classes('line-through')}]")
+# Visible text under an element (skips comments, scripts and styles)
+TEXT_XPATH = etree.XPath(
+    "descendant::text()[not(ancestor::script) and not(ancestor::style)]")
+
+
+def _first(xpath: etree.XPath, element) -> Optional[html.HtmlElement]:
+    """Return the first match of a compiled XPath, or None."""
+    matches = xpath(element)
+    return matches[0] if matches else None
+
+
+def _find_next(element, tag: str) -> Optional[html.HtmlElement]:
+    """Return the first element with a tag after element, like bs4's find_next.
+
+    Walks descendants, then following siblings and their subtrees, then
+    the ancestors' following siblings, stopping at the first match. The
+    equivalent XPath ``(descendant::p | following::p)[1]`` materializes
+    every following node, which made director lookups quadratic in the
+    number of films on the page.
+    """
+    for match in element.iterdescendants(tag):
+        return match
+    node = element
+    while node is not None:
+        for sibling in node.itersiblings():
+            for match in sibling.iter(tag):
+                return match
+        node = node.getparent()
+    return None
+
+
+def _element_text(element) -> str:
+    """Return an element's text with each text node stripped and joined."""
+    return ''.join(text.strip() for text in TEXT_XPATH(element))
+
+
+# Showtime such as "6:00 PM" inside a showtime button
+SHOWTIME_RE = re.compile(r'\d{1,2}:\d{2}\s*(?:AM|PM)')
+
+# "year | country | runtime" metadata line; each field is whitespace-trimmed
+# and anything after a third separator is ignored
+METADATA_LINE_RE = re.compile(
+    r'\s*(?P<year>[^|]*?)\s*\|\s*(?P<country>[^|]*?)\s*'
+    r'(?:\Z|\|\s*(?P<runtime>[^|]*?)\s*(?:\||\Z))')
+
 # Rotating user agents to appear more like different browsers
 USER_AGENTS = [
     'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -45,6 +124,20 @@ USER_AGENTS = [
 ]
 
 
+def _parse_film_containers(content: str) -> Tuple:
+    """Parse a lineup page and return its film containers.
+
+    Args:
+        content: Lineup page HTML
+
+    Returns:
+        Tuple of film container elements
+    """
+    tree = html.document_fromstring(
+        content.encode('utf-8'), parser=LINEUP_HTML_PARSER)
+    return tuple(FILM_CONTAINER_XPATH(tree))
+
+
 class NYFFScraper:
     """Scraper for NYFF film lineup pages."""
 
@@ -59,22 +152,46 @@ class NYFFScraper:
         self.cache_dir = cache_dir
         self.ensure_cache_dir()
 
-    def _setup_session(self) -> None:
-        """Configure session with headers to avoid Cloudflare blocking."""
+        # Film containers of each parsed lineup page, keyed by cache filename
+        # and holding the cache file's mtime they were parsed from
+        self._parsed_pages = {}
+
+    def _setup_session(self, session: Optional[requests.Session] = None) -> None:
+        """Configure session with headers to avoid Cloudflare blocking.
+
+        Args:
+            session: Session to configure (defaults to self.session)
+        """
+        session = session or self.session
+
         # Use a random user agent
         user_agent = random.choice(USER_AGENTS)
         
+        # Pool connections per host so repeated requests reuse keep-alive
+        # sockets instead of re-handshaking
+        adapter = HTTPAdapter(
+            pool_connections=SCRAPER_POOL_CONNECTIONS,
+            pool_maxsize=SCRAPER_POOL_MAXSIZE)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
         # Add basic headers that mimic a real browser
-        self.session.headers.update({
+        session.headers.update({
             'User-Agent': user_agent,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
+            # Only advertise encodings urllib3 can decode (br when brotli is
+            # installed), since it decompresses response.content for us
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Connection': 'keep-alive',
         })
         
         logger.debug(f"Using User-Agent: {user_agent}")
 
+    def close(self) -> None:
+        """Close the HTTP session and its pooled connections."""
+        self.session.close()
+
     def ensure_cache_dir(self) -> None:
         """Create cache directory if it doesn't exist.
 
@@ -85,7 +202,7 @@ class NYFFScraper:
             os.makedirs(self.cache_dir)
 
     def _decode_response_content(self, response) -> str:
-        """Decode response content, handling compression and encoding.
+        """Decode response content to text and check that it looks like HTML.
         
         Args:
             response: requests Response object
@@ -98,34 +215,10 @@ class NYFFScraper:
             logger.debug(f"Response headers: {dict(response.headers)}")
             logger.debug(f"Response encoding: {response.encoding}")
             
-            # Check if response is compressed
-            content_encoding = response.headers.get('content-encoding', '').lower()
+            # urllib3 has already undone any Content-Encoding
             raw_content = response.content
-            
-            logger.debug(f"Content-Encoding: '{content_encoding}', Content length: {len(raw_content)}")
-            
-            if content_encoding == 'gzip':
-                logger.debug("Decompressing gzipped response")
-                try:
-                    raw_content = gzip.decompress(raw_content)
-                except gzip.BadGzipFile:
-                    logger.warning("Failed to decompress gzipped content, using raw content")
-            elif content_encoding == 'deflate':
-                logger.debug("Decompressing deflated response")
-                try:
-                    raw_content = zlib.decompress(raw_content)
-                except zlib.error:
-                    logger.warning("Failed to decompress deflated content, using raw content")
-            elif content_encoding == 'br':
-                logger.debug("Decompressing brotli response")
-                if HAS_BROTLI:
-                    try:
-                        raw_content = brotli.decompress(raw_content)
-                    except brotli.error:
-                        logger.warning("Failed to decompress brotli content, using raw content")
-                else:
-                    logger.warning("Brotli decompression not available, using raw content")
-            
+            logger.debug(f"Content length: {len(raw_content)}")
+
             # Decode to string
             if response.encoding:
                 encoding = response.encoding
@@ -167,14 +260,20 @@ class NYFFScraper:
             url: str,
             filename: str,
             max_age_minutes: Optional[int] = None,
-            force_refresh: bool = False) -> Optional[str]:
+            force_refresh: bool = False,
+            session: Optional[requests.Session] = None) -> Optional[str]:
         """Get content from cache or fetch from URL.
 
+        Cache entries older than max_age_minutes are revalidated with a
+        conditional GET; a 304 reply just marks the cached copy as fresh.
+
         Args:
             url: URL to fetch content from
-            filename: Cache filename to use for storage
+            filename: Cache filename to use for storage (written gzipped as
+                filename + ".gz")
             max_age_minutes: Maximum age of cache file in minutes. If None, no age limit is applied
             force_refresh: If True, ignore cache and always fetch fresh content
+            session: Session to fetch with (defaults to self.session)
 
         Returns:
             HTML content as string if successful, None if fetch failed
@@ -182,16 +281,30 @@ class NYFFScraper:
         Raises:
             NetworkError: If both primary and backup network requests fail
         """
-        cache_file_path = os.path.join(self.cache_dir, filename)
+        # Pages are stored gzipped next to the requested filename; a plain
+        # file left by older versions is still read until it is refreshed
+        legacy_file_path = os.path.join(self.cache_dir, filename)
+        cache_file_path = legacy_file_path + '.gz'
 
-        # Check if we should use cached file
+        # Check if we should use cached file; a single stat gives both
+        # existence and age
         should_use_cache = False
-        if os.path.exists(cache_file_path) and not force_refresh:
+        cache_stat = None
+        read_path = None
+        for candidate in (cache_file_path, legacy_file_path):
+            try:
+                cache_stat = os.stat(candidate)
+            except FileNotFoundError:
+                continue
+            read_path = candidate
+            break
+
+        if cache_stat is not None and not force_refresh:
             if max_age_minutes is None:
                 should_use_cache = True
             else:
                 # Check file age
-                file_age_seconds = time.time() - os.path.getmtime(cache_file_path)
+                file_age_seconds = time.time() - cache_stat.st_mtime
                 file_age_minutes = file_age_seconds / 60
                 if file_age_minutes <= max_age_minutes:
                     should_use_cache = True
@@ -202,10 +315,25 @@ class NYFFScraper:
 
         if should_use_cache:
             logger.info(f"Loading from cache: {filename}")
-            with open(cache_file_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            content = self._read_cache_file(read_path)
+            if content is not None:
+                return content
+            read_path = None
+
+        # A stale cache entry is revalidated with the validators saved when
+        # it was fetched, so an unchanged page comes back as a bodiless 304
+        meta_path = legacy_file_path + '.meta.json'
+        conditional_headers = {}
+        if read_path is not None and not force_refresh:
+            validators = self._load_cache_meta(meta_path)
+            if validators.get('etag'):
+                conditional_headers['If-None-Match'] = validators['etag']
+            conditional_headers['If-Modified-Since'] = (
+                validators.get('last_modified') or
+                formatdate(cache_stat.st_mtime, usegmt=True))
 
         logger.info(f"Fetching: {url}")
+        session = session or self.session
         
         # Retry logic with exponential backoff
         max_retries = 3
@@ -222,10 +350,22 @@ class NYFFScraper:
                 # Rotate user agent for retries to avoid fingerprinting
                 if attempt > 0:
                     new_user_agent = random.choice(USER_AGENTS)
-                    self.session.headers['User-Agent'] = new_user_agent
+                    session.headers['User-Agent'] = new_user_agent
                     logger.debug(f"Switched to User-Agent: {new_user_agent}")
                 
-                response = self.session.get(url, timeout=DEFAULT_REQUEST_TIMEOUT)
+                response = session.get(
+                    url,
+                    headers=conditional_headers,
+                    timeout=DEFAULT_REQUEST_TIMEOUT)
+                if response.status_code == 304 and conditional_headers:
+                    content = self._read_cache_file(read_path)
+                    if content is not None:
+                        logger.info(f"Not modified, keeping cache: {filename}")
+                        os.utime(read_path)
+                        return content
+                    # The cached copy is unusable, so ask for the full page
+                    conditional_headers = {}
+                    continue
                 response.raise_for_status()
                 
                 # Handle compressed responses
@@ -235,8 +375,21 @@ class NYFFScraper:
                 if content is not None:
                     # Cache the content
                     os.makedirs(self.cache_dir, exist_ok=True)
-                    with open(cache_file_path, 'w', encoding='utf-8') as f:
-                        f.write(content)
+                    with open(cache_file_path, 'wb') as f:
+                        f.write(gzip.compress(
+                            content.encode('utf-8'),
+                            compresslevel=CACHE_COMPRESS_LEVEL))
+                    if read_path == legacy_file_path:
+                        # The gzipped copy supersedes the old plain file
+                        try:
+                            os.remove(legacy_file_path)
+                        except OSError:
+                            pass
+                    with open(meta_path, 'w', encoding='utf-8') as f:
+                        json.dump({
+                            'etag': response.headers.get('ETag'),
+                            'last_modified': response.headers.get('Last-Modified')
+                        }, f)
 
                     logger.info(f"Successfully fetched {url} on attempt {attempt + 1}")
                     
@@ -264,6 +417,36 @@ class NYFFScraper:
         logger.error(f"All {max_retries} attempts failed for {url}")
         return None
 
+    @staticmethod
+    def _read_cache_file(path: str) -> Optional[str]:
+        """Read a cached page, or return None if it cannot be decoded.
+
+        Args:
+            path: Gzipped cache file, or a plain one left by older versions
+
+        Returns:
+            HTML content as string, or None if the file is corrupt
+        """
+        # Binary read skips text-mode newline translation
+        with open(path, 'rb') as f:
+            data = f.read()
+        try:
+            if path.endswith('.gz'):
+                data = gzip.decompress(data)
+            return data.decode('utf-8')
+        except (OSError, EOFError, zlib.error, UnicodeDecodeError) as e:
+            logger.warning(f"Cache file {path} is corrupt ({e}), refetching")
+            return None
+
+    @staticmethod
+    def _load_cache_meta(meta_path: str) -> Dict:
+        """Load the saved HTTP validators for a cache entry, if any."""
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
     def scrape_nyff_lineup(
             self,
             url: Optional[str] = None,
@@ -282,10 +465,14 @@ class NYFFScraper:
         url = url or DEFAULT_URL
         backup_url = backup_url or DEFAULT_BACKUP_URL
 
+        if force_refresh:
+            self._parsed_pages.clear()
+
         # Use cache age limit for NYFF lineup
+        source = "nyff_lineup.html"
         content = self.get_cached_or_fetch(
             url,
-            "nyff_lineup.html",
+            source,
             max_age_minutes=DEFAULT_CACHE_MAX_AGE_MINUTES,
             force_refresh=force_refresh)
 
@@ -301,30 +488,22 @@ class NYFFScraper:
                 "https://web.archive.org/web/20250831221540/https://www.filmlinc.org/nyff/nyff63-lineup/",  # Known working snapshot
             ]
             
-            for i, backup in enumerate(backup_urls, 1):
-                logger.info(f"Trying backup URL {i}/{len(backup_urls)}: {backup}")
-                content = self.get_cached_or_fetch(
-                    backup,
-                    f"nyff_lineup_backup_{i}.html",
-                    max_age_minutes=DEFAULT_CACHE_MAX_AGE_MINUTES,
-                    force_refresh=force_refresh)
-                if content:
-                    break
-                    
+            content, source = self._fetch_first_available(
+                [(backup, f"nyff_lineup_backup_{i}.html")
+                 for i, backup in enumerate(backup_urls, 1)],
+                force_refresh=force_refresh)
+
         if not content:
             logger.warning("No content retrieved from primary or any backup URLs")
             return []
 
         try:
-            soup = BeautifulSoup(content, 'html.parser')
+            # Look for film containers based on NYFF structure
+            film_containers = self._get_film_containers(source, content)
         except Exception as e:
             raise ParsingError(f"Failed to parse HTML content: {e}") from e
         films = []
 
-        # Look for film containers based on NYFF structure
-        film_containers = soup.select(
-            'div.py-8.lg\\:py-10.border-b.border-border')
-
         logger.info(f"Found {len(film_containers)} potential film containers")
 
         for container in film_containers:
@@ -335,42 +514,147 @@ class NYFFScraper:
         logger.info(f"Extracted {len(films)} films from NYFF lineup")
         return films
 
+    def _get_film_containers(self, source: str, content: str) -> Tuple:
+        """Return a lineup page's film containers, parsing it once per version.
+
+        Parses are memoized per cache file and reused while the file's mtime
+        is unchanged, so re-scraping a page served from cache skips the
+        parse while a refetched page always misses. Callers must treat the
+        returned elements as read-only.
+
+        Args:
+            source: Cache filename the content was loaded from
+            content: Lineup page HTML
+
+        Returns:
+            Tuple of film container elements
+        """
+        mtime = None
+        legacy_file_path = os.path.join(self.cache_dir, source)
+        for path in (legacy_file_path + '.gz', legacy_file_path):
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+            break
+
+        cached = self._parsed_pages.get(source)
+        if mtime is not None and cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        film_containers = _parse_film_containers(content)
+        if mtime is not None:
+            self._parsed_pages[source] = (mtime, film_containers)
+        return film_containers
+
+    def _fetch_first_available(
+            self,
+            sources: List[Tuple[str, str]],
+            force_refresh: bool = False) -> Tuple[Optional[str], Optional[str]]:
+        """Fetch several mirrors of a page at once and keep the best that works.
+
+        Results are read in list order, so a mirror is only used once every
+        more preferred one has failed, matching the order of trying them one
+        by one. The call returns as soon as that mirror is known; less
+        preferred fetches still in flight finish in the background on their
+        own sessions and just populate their cache files.
+
+        Args:
+            sources: (url, cache filename) pairs to try, most preferred first
+            force_refresh: If True, ignore cache and always fetch fresh content
+
+        Returns:
+            Tuple of (content, cache filename) of the most preferred mirror
+            that returned a page, or (None, None) if all fail
+        """
+        executor = ThreadPoolExecutor(max_workers=len(sources))
+        try:
+            futures = []
+            for i, (url, filename) in enumerate(sources, 1):
+                logger.info(f"Trying backup URL {i}/{len(sources)}: {url}")
+                futures.append(executor.submit(
+                    self._fetch_mirror, url, filename, force_refresh))
+
+            for (url, filename), future in zip(sources, futures):
+                try:
+                    content = future.result()
+                except Exception as e:
+                    logger.warning(f"Backup URL {url} failed: {e}")
+                    continue
+                if content:
+                    logger.info(f"Using backup URL: {url}")
+                    return content, filename
+            return None, None
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fetch_mirror(
+            self,
+            url: str,
+            filename: str,
+            force_refresh: bool) -> Optional[str]:
+        """Fetch one mirror for _fetch_first_available on its own session.
+
+        A short-lived session keeps the mirror's retries and User-Agent
+        rotation off self.session, so a fetch left running in the background
+        never races with close().
+
+        Args:
+            url: URL to fetch content from
+            filename: Cache filename to use for storage
+            force_refresh: If True, ignore cache and always fetch fresh content
+
+        Returns:
+            HTML content as string if successful, None if fetch failed
+        """
+        session = requests.Session()
+        try:
+            self._setup_session(session)
+            return self.get_cached_or_fetch(
+                url,
+                filename,
+                max_age_minutes=DEFAULT_CACHE_MAX_AGE_MINUTES,
+                force_refresh=force_refresh,
+                session=session)
+        finally:
+            session.close()
+
     def extract_film_data(self, element) -> Optional[Dict]:
         """Extract film data from a film element.
 
         Args:
-            element: BeautifulSoup element containing film data
+            element: lxml element containing film data
 
         Returns:
             Dictionary of film data or None if extraction fails
         """
         try:
             # Look for the film title link
-            title_link = element.select_one('a[href*="/nyff2025/films/"]')
-            if not title_link:
+            title_link = _first(TITLE_LINK_XPATH, element)
+            if title_link is None:
                 return None
 
             # Extract title
-            title_div = title_link.select_one('div')
-            if not title_div:
+            title_div = _first(TITLE_DIV_XPATH, title_link)
+            if title_div is None:
                 return None
 
-            title = title_div.get_text(strip=True)
+            title = _element_text(title_div)
             if not title:
                 return None
 
             # Extract director
             director = None
-            director_elem = title_link.find_next('p')
-            if director_elem:
-                director_text = director_elem.get_text(strip=True)
+            director_elem = _find_next(title_link, 'p')
+            if director_elem is not None:
+                director_text = _element_text(director_elem)
                 director = director_text if director_text else None
 
             # Extract description
             description = None
-            prose_section = element.select_one('.typography.prose p')
-            if prose_section:
-                description_text = prose_section.get_text(strip=True)
+            prose_section = _first(PROSE_XPATH, element)
+            if prose_section is not None:
+                description_text = _element_text(prose_section)
                 description = description_text if description_text else None
 
             # Extract showtimes
@@ -400,7 +684,7 @@ class NYFFScraper:
         """Extract year, country, and runtime metadata.
 
         Args:
-            element: BeautifulSoup element containing metadata
+            element: lxml element containing metadata
 
         Returns:
             Tuple of (year, country, runtime), each can be None if not found
@@ -410,18 +694,19 @@ class NYFFScraper:
         runtime = None
 
         # Strategy 1: Look for flex container with metadata paragraphs
-        flex_container = element.select_one('div.flex.flex-wrap')
-        if flex_container:
-            metadata_ps = flex_container.select(
-                'p[data-typography-mobile="body-xs"]')
+        flex_container = _first(FLEX_XPATH, element)
+        if flex_container is not None:
+            metadata_ps = METADATA_XPATH(flex_container)
 
             for p in metadata_ps:
-                text = p.get_text(strip=True)
+                text = _element_text(p)
                 # Remove the separator "|" from text
                 clean_text = text.replace('|', '').strip()
 
-                # Check if it's a year (4 digits)
-                if clean_text.isdigit() and len(clean_text) == METADATA_YEAR_LENGTH:
+                # Check if it's a year (4 ASCII digits); the length test
+                # runs first so most lines never reach the digit scan
+                if (len(clean_text) == METADATA_YEAR_LENGTH
+                        and clean_text.isascii() and clean_text.isdigit()):
                     year = clean_text
                 # Check if it contains "minutes" (runtime)
                 elif 'minute' in clean_text.lower():
@@ -437,20 +722,19 @@ class NYFFScraper:
 
         # Strategy 2: Fallback to original method
         if year is None and country is None and runtime is None:
-            metadata_ps = element.select('p[data-typography-mobile="body-xs"]')
+            metadata_ps = METADATA_XPATH(element)
             for p in metadata_ps:
-                text = p.get_text(strip=True)
-                if '|' in text:
-                    # This is likely the year|country|runtime line
-                    parts = [part.strip() for part in text.split('|')]
-                    if len(parts) >= 1 and parts[0].isdigit():
-                        year = parts[0]
-                    if len(parts) >= 2:
-                        country = parts[1]
-                    if len(parts) >= 3 and (
-                        'minute' in parts[2].lower() or parts[2].replace(
+                # This is likely the year|country|runtime line
+                match = METADATA_LINE_RE.match(_element_text(p))
+                if match:
+                    year, country, runtime = match.group(
+                        'year', 'country', 'runtime')
+                    if not year.isdigit():
+                        year = None
+                    if not runtime or not (
+                        'minute' in runtime.lower() or runtime.replace(
                             ' ', '').isdigit()):
-                        runtime = parts[2]
+                        runtime = None
                     break
 
         return year, country, runtime
@@ -459,7 +743,7 @@ class NYFFScraper:
         """Extract showtime information from film element.
 
         Args:
-            element: BeautifulSoup element containing showtime data
+            element: lxml element containing showtime data
 
         Returns:
             List of showtime dictionaries
@@ -467,34 +751,31 @@ class NYFFScraper:
         showtimes = []
 
         # Look for the showtimes section
-        showtime_section = element.select_one('div.flex.flex-col.gap-2.mt-4')
-        if not showtime_section:
+        showtime_section = _first(SHOWTIME_SECTION_XPATH, element)
+        if showtime_section is None:
             return showtimes
 
         # Find date sections
-        date_sections = showtime_section.select(
-            'div.flex.flex-col.gap-2.border-t.border-border.pt-2')
+        date_sections = DATE_SECTION_XPATH(showtime_section)
 
         for date_section in date_sections:
             # Extract date
-            date_elem = date_section.select_one(
-                'p[data-typography-mobile="d-eyebrow-sm"]')
+            date_elem = _first(DATE_ELEM_XPATH, date_section)
             date = None
-            if date_elem:
-                date_text = date_elem.get_text(strip=True)
+            if date_elem is not None:
+                date_text = _element_text(date_elem)
                 date = date_text if date_text else None
 
             # Extract time buttons
-            time_buttons = date_section.select('button')
+            time_buttons = BUTTON_XPATH(date_section)
             for button in time_buttons:
-                button_text = button.get_text(strip=True)
+                button_text = _element_text(button)
 
-                # Extract time from button text
-                time_match = re.search(
-                    r'\d{1,2}:\d{2}\s*(?:AM|PM)', button_text)
-                showtime_time = None
-                if time_match:
-                    showtime_time = time_match.group()
+                # Extract time from button text; buttons without a time are
+                # skipped before any of the checks below run
+                time_match = SHOWTIME_RE.search(button_text)
+                if not time_match:
+                    continue
 
                 # Check for special notes
                 notes = []
@@ -503,29 +784,24 @@ class NYFFScraper:
                 if 'Intro' in button_text:
                     notes.append('Intro')
 
-                # Check availability - multiple ways a showtime can be sold out
-                button_classes = ' '.join(button.get('class', []))
-                is_disabled = (
+                # Check availability - multiple ways a showtime can be sold
+                # out. The line-through lookup on child elements (new
+                # structure) only runs when the button is not disabled.
+                button_classes = button.get('class', '')
+                is_available = not (
                     button.get('disabled') is not None or
                     'cursor-not-allowed' in button_classes or
-                    'disabled' in button_classes
+                    'disabled' in button_classes or
+                    LINETHROUGH_XPATH(button)
                 )
 
-                # Check for line-through styling on child elements (new
-                # structure)
-                has_linethrough = bool(button.select('.line-through'))
-
-                is_available = not (is_disabled or has_linethrough)
-
-                if showtime_time:
-                    showtime_data = {
-                        "date": date,
-                        "time": showtime_time,
-                        "venue": "TBA",
-                        "notes": notes,
-                        "available": is_available,
-                        "raw_text": button_text
-                    }
-                    showtimes.append(showtime_data)
+                showtimes.append({
+                    "date": date,
+                    "time": time_match.group(),
+                    "venue": "TBA",
+                    "notes": notes,
+                    "available": is_available,
+                    "raw_text": button_text
+                })
 
         return showtimes
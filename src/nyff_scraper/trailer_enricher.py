@@ -6,31 +6,224 @@ Author: Jack Murphy
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import os
 import re
+import hashlib
+import json
 import time
 import string
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+from urllib.parse import urlencode
 
 logger = logging.getLogger(__name__)
 
+# Trailer searches run on a few threads; YouTube requests (searches and
+# watch pages alike) are spaced at least this many seconds apart across all
+# of them
+TRAILER_SEARCH_WORKERS = 4
+TRAILER_SEARCH_INTERVAL = 2.0
+
+# Candidate videos from a YouTube search are cached on disk per query and
+# reused for this long before searching again
+TRAILER_CACHE_MAX_AGE_DAYS = 7
+
+# Retry policy for the shared YouTube session
+TRAILER_MAX_RETRIES = 3
+TRAILER_RETRY_BACKOFF = 1.0
+TRAILER_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Characters of a search query kept in its cache filename for readability;
+# the name is made unique by a hash of the full query
+SEARCH_CACHE_SLUG_CHARS = 40
+
+# Video IDs embedded in a YouTube search results page
+VIDEO_ID_RE = re.compile(r'"videoId":"([^"]+)"')
+
+# Distinct search results whose watch pages are checked, to avoid too many
+# requests per film; a few are fetched at once, in rank order
+TRAILER_CANDIDATE_LIMIT = 10
+TRAILER_CANDIDATE_WORKERS = 3
+
+# Title YouTube embeds next to each videoId in the results page JSON, looked
+# for only within this many characters of the ID so a result's title is
+# never taken from the next one
+SERP_TITLE_RE = re.compile(
+    r'"title":\{(?:"runs":\[\{"text"|"simpleText"):"((?:[^"\\]|\\.)*)"')
+SERP_TITLE_WINDOW = 2000
+
+# <title> of a YouTube watch page
+PAGE_TITLE_RE = re.compile(r"<title>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+
+# Translation table that deletes ASCII punctuation
+PUNCTUATION_TABLE = str.maketrans("", "", string.punctuation)
+
 
 class TrailerEnricher:
     """Enricher for adding YouTube trailer URLs to film data."""
 
-    def __init__(self):
-        """Initialize the trailer enricher."""
+    def __init__(self, cache_dir: str = "cache"):
+        """Initialize the trailer enricher.
+
+        Args:
+            cache_dir: Directory to cache YouTube search results
+        """
+        self.cache_dir = cache_dir
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        # Every request goes to www.youtube.com, so one keep-alive pool
+        # sized for all search and candidate threads serves the whole run,
+        # and transient errors are retried with backoff
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=TRAILER_SEARCH_WORKERS * TRAILER_CANDIDATE_WORKERS,
+            max_retries=Retry(
+                total=TRAILER_MAX_RETRIES,
+                backoff_factor=TRAILER_RETRY_BACKOFF,
+                status_forcelist=TRAILER_RETRY_STATUSES))
+        self.session.mount('https://', adapter)
+
+        # Shared across search and candidate threads to space out YouTube
+        # requests
+        self._rate_lock = threading.Lock()
+        self._next_search_time = 0.0
+
+    def close(self) -> None:
+        """Close the HTTP session and its pooled connections."""
+        self.session.close()
+
+    def _wait_for_search_slot(self) -> None:
+        """Block until this thread may send a request to YouTube."""
+        with self._rate_lock:
+            now = time.monotonic()
+            start = max(now, self._next_search_time)
+            self._next_search_time = start + TRAILER_SEARCH_INTERVAL
+        if start > now:
+            time.sleep(start - now)
 
     @staticmethod
     def normalize_text(text: str) -> str:
         """Lowercase, strip punctuation, collapse spaces."""
-        translator = str.maketrans("", "", string.punctuation)
-        return " ".join(text.lower().translate(translator).split())
+        return " ".join(text.lower().translate(PUNCTUATION_TABLE).split())
+
+    @staticmethod
+    def _build_query(title: str, year: str, director: str = "") -> str:
+        """Build the YouTube search query for a film's trailer."""
+        query_parts = [title]
+        if director:
+            query_parts.append(director)
+        if year:
+            query_parts.append(year)
+        query_parts.append("trailer")
+        return " ".join(query_parts)
+
+    @staticmethod
+    def _candidate_videos(text: str) -> List[Tuple[str, Optional[str]]]:
+        """Return the first distinct videos on a YouTube results page.
+
+        The page repeats each ID several times per result card, so IDs are
+        de-duplicated as they are found and the scan stops once
+        TRAILER_CANDIDATE_LIMIT have been collected. Each video's title is
+        read from the results JSON between its ID and the next result's.
+
+        Returns:
+            (video ID, title or None if not found on the page) pairs
+        """
+        first_matches = []
+        seen = set()
+        for match in VIDEO_ID_RE.finditer(text):
+            vid = match.group(1)
+            if vid in seen:
+                continue
+            seen.add(vid)
+            first_matches.append(match)
+            # One extra result only bounds the last candidate's title
+            if len(first_matches) > TRAILER_CANDIDATE_LIMIT:
+                break
+
+        candidates = []
+        for i, match in enumerate(first_matches[:TRAILER_CANDIDATE_LIMIT]):
+            end = match.end() + SERP_TITLE_WINDOW
+            if i + 1 < len(first_matches):
+                end = min(end, first_matches[i + 1].start())
+            title_match = SERP_TITLE_RE.search(text, match.end(), end)
+            title = None
+            if title_match:
+                try:
+                    title = json.loads(f'"{title_match.group(1)}"')
+                except ValueError:
+                    title = title_match.group(1)
+            candidates.append((match.group(1), title))
+        return candidates
+
+    def _search_cache_path(self, query: str) -> str:
+        """Return the cache file for a search query.
+
+        The name ends in a hash of the normalized query, so queries that
+        only differ in punctuation get separate files and long titles never
+        exceed filename length limits.
+        """
+        normalized_query = " ".join(query.lower().split())
+        query_hash = hashlib.sha1(normalized_query.encode('utf-8')).hexdigest()
+        slug = re.sub(r'[^\w]+', '_', normalized_query)[:SEARCH_CACHE_SLUG_CHARS]
+        return os.path.join(
+            self.cache_dir, f"youtube_search_{slug}_{query_hash}.json")
+
+    def _load_cached_candidates(
+            self, query: str) -> Optional[List[Tuple[str, Optional[str]]]]:
+        """Return cached candidate videos for a query, if fresh enough.
+
+        Args:
+            query: YouTube search query
+
+        Returns:
+            (video ID, title) pairs, or None if there is no usable cache entry
+        """
+        cache_path = self._search_cache_path(query)
+        try:
+            file_age_days = (time.time() - os.path.getmtime(cache_path)) / 86400
+            if file_age_days > TRAILER_CACHE_MAX_AGE_DAYS:
+                return None
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return [(vid, video_title) for vid, video_title in json.load(f)]
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _save_cached_candidates(
+            self,
+            query: str,
+            candidates: List[Tuple[str, Optional[str]]]) -> None:
+        """Save candidate videos for a query to the cache."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self._search_cache_path(query), 'w', encoding='utf-8') as f:
+                json.dump(candidates, f, ensure_ascii=False)
+        except OSError as e:
+            logger.warning(
+                "Could not cache YouTube results for '%s': %s", query, e)
+
+    def _fetch_video_title(self, vid: str) -> Optional[str]:
+        """Return the <title> of a YouTube watch page, or None on failure."""
+        video_url = f"https://www.youtube.com/watch?v={vid}"
+        try:
+            self._wait_for_search_slot()
+            vresp = self.session.get(video_url, timeout=10)
+            vresp.raise_for_status()
+
+            # Extract <title> tag from the HTML
+            m = PAGE_TITLE_RE.search(vresp.text)
+            return m.group(1) if m else None
+
+        except Exception as e:
+            logger.debug("Error checking video %s: %s", vid, e)
+            return None
 
     def search_youtube_trailer(
             self,
@@ -40,66 +233,78 @@ class TrailerEnricher:
             is_restoration: bool = False) -> Optional[str]:
         """Search YouTube for a film trailer, validating against the film title."""
         try:
-            query_parts = [title]
-            if director:
-                query_parts.append(director)
-            if year:
-                query_parts.append(year)
-            query_parts.append("trailer")
-            query = " ".join(query_parts)
-            logger.info(f"Searching YouTube for: {query}")
-
-            search_url = "https://www.youtube.com/results"
-            params = {"search_query": query}
-            response = self.session.get(search_url, params=params, timeout=10)
-            response.raise_for_status()
-
-            # Collect all candidate video IDs
-            video_ids = re.findall(r'"videoId":"([^"]+)"', response.text)
-            if not video_ids:
-                logger.warning(f"No video IDs found for '{title}'")
+            query = self._build_query(title, year, director)
+            candidates = self._load_cached_candidates(query)
+            if candidates is not None:
+                logger.info("Loading YouTube results from cache: %s", query)
+            else:
+                logger.info("Searching YouTube for: %s", query)
+
+                search_url = "https://www.youtube.com/results"
+                params = {"search_query": query}
+                self._wait_for_search_slot()
+                response = self.session.get(
+                    search_url, params=params, timeout=10)
+                response.raise_for_status()
+
+                # Collect the first distinct candidate videos; pages without
+                # any (e.g. consent or error pages) are not cached
+                candidates = self._candidate_videos(response.text)
+                if candidates:
+                    self._save_cached_candidates(query, candidates)
+
+            if not candidates:
+                logger.warning("No video IDs found for '%s'", title)
                 return ""
 
             film_norm = self.normalize_text(title)
-
-            for vid in video_ids[:10]:  # check top 10 to avoid too many requests
-                video_url = f"https://www.youtube.com/watch?v={vid}"
-                try:
-                    vresp = self.session.get(video_url, timeout=10)
-                    vresp.raise_for_status()
-
-                    # Extract <title> tag from the HTML
-                    m = re.search(
-                        r"<title>(.*?)</title>",
-                        vresp.text,
-                        re.IGNORECASE | re.DOTALL)
-                    if not m:
+            film_words = set(film_norm.split())
+
+            # Titles come from the results page; a watch page is only
+            # fetched for a candidate whose title was not found there.
+            # Those fetches run a few at a time but are checked in rank
+            # order, and candidates not yet started are cancelled once one
+            # matches. No pool is started when every title is known.
+            executor = None
+            if all(video_title is not None for _, video_title in candidates):
+                video_titles = (video_title for _, video_title in candidates)
+            else:
+                executor = ThreadPoolExecutor(
+                    max_workers=TRAILER_CANDIDATE_WORKERS)
+                video_titles = executor.map(
+                    lambda candidate: (
+                        candidate[1] if candidate[1] is not None
+                        else self._fetch_video_title(candidate[0])),
+                    candidates)
+            try:
+                for (vid, _), video_title in zip(candidates, video_titles):
+                    if video_title is None:
                         continue
 
-                    video_title = m.group(1)
+                    video_url = f"https://www.youtube.com/watch?v={vid}"
                     video_title_norm = self.normalize_text(video_title)
 
                     # Check if most of the film title words appear in video
                     # title
-                    film_words = set(film_norm.split())
                     overlap = sum(
                         1 for w in film_words if w in video_title_norm)
 
                     if film_words and overlap / len(film_words) >= 0.6:
                         logger.info(
-                            f"Matched trailer for '{title}' -> {video_url} ({video_title.strip()})")
+                            "Matched trailer for '%s' -> %s (%s)",
+                            title, video_url, video_title.strip())
                         return video_url
-
-                except Exception as e:
-                    logger.debug(f"Error checking video {vid}: {e}")
-                    continue
+            finally:
+                if executor is not None:
+                    executor.shutdown(wait=False, cancel_futures=True)
 
             logger.warning(
-                f"No matching trailer found for '{title}' after checking candidates")
+                "No matching trailer found for '%s' after checking candidates",
+                title)
             return ""
 
         except Exception as e:
-            logger.error(f"Error searching YouTube for '{title}': {e}")
+            logger.error("Error searching YouTube for '%s': %s", title, e)
             return ""
 
     def construct_youtube_search_url(
@@ -117,14 +322,9 @@ class TrailerEnricher:
         Returns:
             YouTube search URL
         """
-        query_parts = [title]
-        if director:
-            query_parts.append(director)
-        if year:
-            query_parts.append(year)
-        query_parts.append("trailer")
-        query = " ".join(query_parts).replace(" ", "+")
-        return f"https://www.youtube.com/results?search_query={query}"
+        params = urlencode(
+            {"search_query": self._build_query(title, year, director)})
+        return f"https://www.youtube.com/results?{params}"
 
     def enrich_films(self, films: List[Dict], search_trailers: bool = True,
                      limit: int = None) -> List[Dict]:
@@ -140,13 +340,20 @@ class TrailerEnricher:
         """
         if limit:
             films = films[:limit]
-            logger.info(f"Processing limited set of {len(films)} films")
+            logger.info("Processing limited set of %d films", len(films))
 
         enriched_films = []
-
-        for i, film in enumerate(films):
+        # Films to search for, grouped by search key so that films sharing
+        # a title, year and director trigger a single search
+        to_search: Dict[Tuple[str, str, str], List[Dict]] = {}
+
+        # Per-film messages use lazy %-formatting so a quiet run does not
+        # build them
+        total_films = len(films)
+        for i, film in enumerate(films, 1):
             logger.info(
-                f"Processing film {i + 1}/{len(films)}: {film.get('title', 'Unknown')}")
+                "Processing film %d/%d: %s",
+                i, total_films, film.get('title', 'Unknown'))
 
             title = film.get('title', '')
             year = film.get('year', '')
@@ -156,16 +363,14 @@ class TrailerEnricher:
             # Skip trailer search for shorts programs
             if is_short_program:
                 logger.info(
-                    f"Skipping trailer search for shorts program: {title}")
+                    "Skipping trailer search for shorts program: %s", title)
                 film['trailer_url'] = ""
                 film['youtube_search_url'] = ""
             elif search_trailers and title and year:
-                # Active search for trailer
-                trailer_url = self.search_youtube_trailer(
-                    title, year, director)
-                film['trailer_url'] = trailer_url
-                # Be nice to Google - delay between searches
-                time.sleep(2)
+                # Active search for trailer, filled in below
+                film['trailer_url'] = ""
+                to_search.setdefault(
+                    (title, year, director or ""), []).append(film)
 
                 # Always provide manual search URL
                 film['youtube_search_url'] = self.construct_youtube_search_url(
@@ -181,4 +386,14 @@ class TrailerEnricher:
 
             enriched_films.append(film)
 
+        # Searches overlap across threads; _wait_for_search_slot keeps them
+        # spaced out to be nice to YouTube
+        if to_search:
+            with ThreadPoolExecutor(max_workers=TRAILER_SEARCH_WORKERS) as executor:
+                trailer_urls = executor.map(
+                    lambda key: self.search_youtube_trailer(*key), to_search)
+                for key, trailer_url in zip(to_search, trailer_urls):
+                    for film in to_search[key]:
+                        film['trailer_url'] = trailer_url
+
         return enriched_films
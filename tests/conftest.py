@@ -0,0 +1,8 @@
+"""Shared pytest configuration for the NYFF scraper tests."""
+
+import os
+import sys
+
+# Allow running the tests from a checkout without installing the package
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src'))
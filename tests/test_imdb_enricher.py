@@ -0,0 +1,137 @@
+"""Tests for the IMDb search result scans in IMDbEnricher."""
+
+import os
+
+import pytest
+from bs4 import BeautifulSoup
+
+from nyff_scraper.imdb_enricher import IMDbEnricher
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+def load_fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def first_results(candidates):
+    """Keep the first validation result seen for each IMDb ID."""
+    results = {}
+    for imdb_id, validation_result in candidates:
+        results.setdefault(imdb_id, validation_result)
+    return results
+
+
+@pytest.fixture
+def enricher(tmp_path):
+    enricher = IMDbEnricher(cache_dir=str(tmp_path))
+    yield enricher
+    enricher.close()
+
+
+@pytest.mark.parametrize('film_title, year', [
+    ('The Film', '2019'),
+    ('The Film', '2021'),
+    ('The Film', '2025'),
+    ('Sirāt', '2025'),
+    ('Sirāt', '2024'),
+    ('Father & Son', '2025'),
+])
+def test_scan_matches_soup_path(enricher, film_title, year):
+    content = load_fixture('imdb_find_results.html')
+
+    scanned = list(enricher._find_search_candidates(
+        content, film_title, year, ''))
+    parsed = first_results(enricher._find_search_candidates_soup(
+        content, film_title, year, ''))
+
+    assert [imdb_id for imdb_id, _ in scanned] == list(parsed)
+    assert dict(scanned) == parsed
+
+
+def test_year_in_next_result_markup_is_ignored(enricher):
+    content = load_fixture('imdb_find_results.html')
+
+    results = dict(enricher._find_search_candidates(
+        content, 'The Film', '2025', ''))
+
+    # "2025" only appears in the next result's image URL
+    assert results['tt1234567'] == 'invalid'
+
+
+def test_year_must_be_a_whole_word(enricher):
+    content = load_fixture('imdb_find_results.html')
+
+    results = dict(enricher._find_search_candidates(
+        content, 'The Film', '201', ''))
+
+    assert results['tt1234567'] == 'invalid'
+
+
+def test_falls_back_to_soup_without_text_links(enricher):
+    content = load_fixture('imdb_find_nested_titles.html')
+
+    results = first_results(enricher._find_search_candidates(
+        content, 'Nested Title', '2025', ''))
+
+    assert results == {'tt5555555': 'valid'}
+
+
+def test_advanced_results_map_to_their_own_container(enricher):
+    soup = BeautifulSoup(
+        load_fixture('imdb_advanced_results.html'), 'html.parser')
+
+    results = enricher._map_result_containers(
+        soup, 'h3.ipc-title a, .lister-item-header a')
+
+    assert list(results) == ['tt1111111', 'tt2222222', 'tt3333333']
+    # The title link is used, not the poster link before it
+    assert [link.get_text(strip=True) for link, _ in results.values()] == [
+        'The Film', 'The Film', 'Other Film']
+    container_texts = {imdb_id: container.get_text()
+                       for imdb_id, (_, container) in results.items()}
+    assert enricher._validate_advanced_result(
+        container_texts['tt2222222'], 'The Film', '2025', 'John Roe')
+    assert not enricher._validate_advanced_result(
+        container_texts['tt1111111'], 'The Film', '2025', 'John Roe')
+    assert enricher._validate_advanced_result(
+        container_texts['tt3333333'], 'Other Film', '2024', '')
+
+
+def test_advanced_result_without_container_is_rejected(enricher):
+    assert not enricher._validate_advanced_result(
+        None, 'The Film', '2025', '')
+
+
+def test_title_jsonld_is_parsed_once_per_title(enricher, monkeypatch):
+    content = (
+        '<html><head><script type="application/ld+json">'
+        '{"datePublished": "2025-10-03",'
+        ' "director": [{"@type": "Person", "name": "Jane Doe"}],'
+        ' "creator": [{"@type": "Organization", "name": "Film Co"}]}'
+        '</script></head><body></body></html>')
+    monkeypatch.setattr(
+        enricher, 'get_cached_or_fetch',
+        lambda url, filename: content if '/companycredits/' not in url else None)
+    parses = []
+    extract_jsonld = enricher._extract_jsonld
+    monkeypatch.setattr(
+        enricher, '_extract_jsonld',
+        lambda page: parses.append(page) or extract_jsonld(page))
+
+    assert enricher.get_theatrical_release_date('tt1234567') == '2025-10-03'
+    assert enricher.get_director_from_imdb_page('tt1234567') == 'Jane Doe'
+    assert enricher.get_company_credits('tt1234567') == {
+        'production_companies': ['Film Co'], 'distributors': []}
+    assert len(parses) == 1
+
+
+def test_falls_back_to_soup_when_a_title_link_is_missed(enricher):
+    content = load_fixture('imdb_find_mixed_titles.html')
+
+    results = first_results(enricher._find_search_candidates(
+        content, 'Mixed Title', '2025', ''))
+
+    # Only the first title link is plain text; the scan alone misses the second
+    assert results == {'tt6666666': 'invalid', 'tt7777777': 'valid'}
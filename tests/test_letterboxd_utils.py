@@ -0,0 +1,106 @@
+"""Tests for LetterboxdScraper page fetching and caching."""
+
+import os
+import time
+
+import pytest
+
+from nyff_scraper.letterboxd_utils import LetterboxdScraper
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b''):
+        self.status_code = status_code
+        self.content = content
+        self.headers = {}
+
+    def raise_for_status(self):
+        pass
+
+
+@pytest.fixture
+def scraper(tmp_path):
+    return LetterboxdScraper(cache_dir=str(tmp_path))
+
+
+def test_page_evicted_during_revalidation_is_served(scraper, monkeypatch, tmp_path):
+    cache_path = tmp_path / 'letterboxd_user_films_page_1.html'
+    cache_path.write_bytes(b'<html>cached</html>')
+    stale = time.time() - 2 * 24 * 60 * 60
+    os.utime(cache_path, (stale, stale))
+
+    # Another fetch thread evicts the page while this one waits to send
+    monkeypatch.setattr(
+        scraper, '_wait_for_request_slot', lambda: cache_path.unlink())
+    monkeypatch.setattr(
+        scraper.session, 'get', lambda url, **kwargs: FakeResponse(304))
+
+    content = scraper._get_cached_or_fetch_bytes(
+        'https://letterboxd.com/user/films/page/1/', cache_path.name)
+
+    assert content == b'<html>cached</html>'
+
+
+def test_missing_page_is_a_cache_miss(scraper, monkeypatch):
+    monkeypatch.setattr(scraper, '_wait_for_request_slot', lambda: None)
+    monkeypatch.setattr(
+        scraper.session, 'get',
+        lambda url, **kwargs: FakeResponse(200, b'<html>fresh</html>'))
+
+    content = scraper._get_cached_or_fetch_bytes(
+        'https://letterboxd.com/user/films/page/1/',
+        'letterboxd_user_films_page_1.html')
+
+    assert content == b'<html>fresh</html>'
+
+
+def films_page(*titles):
+    return ''.join(
+        f'<div class="react-component" data-item-name="{title} (2020)"></div>'
+        for title in titles).join(['<html><body>', '</body></html>']).encode()
+
+
+def test_scrape_stops_at_first_empty_page(scraper, monkeypatch):
+    pages = {1: films_page('First'), 2: films_page('Second'),
+             3: films_page(), 4: films_page('Never')}
+    fetched = []
+
+    def fake_fetch(url, filename, max_age_minutes=None):
+        page = int(url.rstrip('/').rsplit('/', 1)[1])
+        fetched.append(page)
+        return pages[page]
+
+    monkeypatch.setattr(scraper, '_get_cached_or_fetch_bytes', fake_fetch)
+
+    user_data = scraper.scrape_user_films('user', max_pages=5)
+
+    assert [film['title'] for film in user_data['films']] == ['First', 'Second']
+    assert sorted(fetched) == [1, 2, 3]
+
+
+def test_single_page_user_fetches_one_batch(scraper, monkeypatch):
+    fetched = []
+
+    def fake_fetch(url, filename, max_age_minutes=None):
+        page = int(url.rstrip('/').rsplit('/', 1)[1])
+        fetched.append(page)
+        return films_page('Only') if page == 1 else films_page()
+
+    monkeypatch.setattr(scraper, '_get_cached_or_fetch_bytes', fake_fetch)
+
+    user_data = scraper.scrape_user_films('user', max_pages=5)
+
+    assert [film['title'] for film in user_data['films']] == ['Only']
+    assert sorted(fetched) == [1, 2, 3]
+
+
+def test_unparseable_page_is_skipped(scraper, monkeypatch):
+    pages = {1: b'   ', 2: films_page('Second'), 3: films_page()}
+    monkeypatch.setattr(
+        scraper, '_get_cached_or_fetch_bytes',
+        lambda url, filename, max_age_minutes=None: pages[
+            int(url.rstrip('/').rsplit('/', 1)[1])])
+
+    user_data = scraper.scrape_user_films('user', max_pages=3)
+
+    assert [film['title'] for film in user_data['films']] == ['Second']
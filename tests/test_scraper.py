@@ -0,0 +1,110 @@
+"""Tests for NYFFScraper fetching and caching."""
+
+import gzip
+import os
+import threading
+import time
+
+import pytest
+
+from nyff_scraper.scraper import NYFFScraper
+
+
+@pytest.fixture
+def scraper(tmp_path):
+    scraper = NYFFScraper(cache_dir=str(tmp_path))
+    yield scraper
+    scraper.close()
+
+
+def test_first_available_prefers_earlier_mirrors(scraper, monkeypatch):
+    release = threading.Event()
+    results = {
+        'https://a.example/': (0.2, None),
+        'https://b.example/': (0.1, 'B'),
+        'https://c.example/': (0.0, 'C'),
+    }
+
+    def fake_fetch(url, filename, max_age_minutes=None,
+                   force_refresh=False, session=None):
+        assert session is not scraper.session
+        if url == 'https://d.example/':
+            release.wait(5)
+            return 'D'
+        delay, content = results[url]
+        time.sleep(delay)
+        return content
+
+    monkeypatch.setattr(scraper, 'get_cached_or_fetch', fake_fetch)
+    sources = [(url, f'mirror_{i}.html') for i, url in enumerate(
+        [*results, 'https://d.example/'], 1)]
+
+    start = time.monotonic()
+    try:
+        content, source = scraper._fetch_first_available(sources)
+    finally:
+        release.set()
+
+    # A faster, less preferred mirror loses, and a slow one is not waited on
+    assert (content, source) == ('B', 'mirror_2.html')
+    assert time.monotonic() - start < 2
+
+
+@pytest.mark.parametrize('filename, data', [
+    # A gzip stream cut off partway through its compressed body
+    ('page.html.gz', gzip.compress(b'<html>' + b'x' * 4096)[:40]),
+    # A gzip header followed by garbage instead of deflate data
+    ('page.html.gz', b'\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\x03' + b'\xff' * 32),
+    # A legacy plain-text cache file that is not UTF-8
+    ('page.html', '<html>caf\xe9</html>'.encode('latin-1')),
+], ids=['truncated-gzip', 'corrupt-deflate', 'non-utf8-legacy'])
+def test_corrupt_cache_file_is_refetched(scraper, monkeypatch, tmp_path,
+                                         filename, data):
+    (tmp_path / filename).write_bytes(data)
+    fetched = []
+
+    class FakeResponse:
+        status_code = 200
+        headers = {}
+        content = b'<html>fresh</html>'
+        text = '<html>fresh</html>'
+        encoding = 'utf-8'
+
+        def raise_for_status(self):
+            pass
+
+    def fake_get(url, **kwargs):
+        fetched.append(url)
+        return FakeResponse()
+
+    monkeypatch.setattr(scraper.session, 'get', fake_get)
+    monkeypatch.setattr('nyff_scraper.scraper.time.sleep', lambda _: None)
+
+    content = scraper.get_cached_or_fetch(
+        'https://example.com/', 'page.html')
+
+    assert content == '<html>fresh</html>'
+    assert fetched == ['https://example.com/']
+
+
+def test_lineup_parse_is_reused_until_the_cache_file_changes(
+        scraper, monkeypatch, tmp_path):
+    from nyff_scraper import scraper as scraper_module
+
+    cache_path = tmp_path / 'nyff_lineup.html.gz'
+    cache_path.write_bytes(gzip.compress(b'<html><body></body></html>'))
+    parses = []
+    parse = scraper_module._parse_film_containers
+    monkeypatch.setattr(
+        scraper_module, '_parse_film_containers',
+        lambda content: parses.append(content) or parse(content))
+
+    scraper.scrape_nyff_lineup()
+    scraper.scrape_nyff_lineup()
+    assert len(parses) == 1
+
+    # A rewritten cache file is parsed again
+    stat = cache_path.stat()
+    os.utime(cache_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+    scraper.scrape_nyff_lineup()
+    assert len(parses) == 2
@@ -0,0 +1,62 @@
+"""Tests for TrailerEnricher searching and caching."""
+
+import pytest
+
+from nyff_scraper.trailer_enricher import TrailerEnricher
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+    def raise_for_status(self):
+        pass
+
+
+@pytest.fixture
+def enricher(tmp_path):
+    enricher = TrailerEnricher(cache_dir=str(tmp_path))
+    yield enricher
+    enricher.close()
+
+
+def test_watch_page_fetches_wait_for_a_request_slot(enricher, monkeypatch):
+    slots = []
+    gets = []
+    monkeypatch.setattr(
+        enricher, '_wait_for_search_slot', lambda: slots.append(None))
+
+    def fake_get(url, **kwargs):
+        # Each request takes a slot of its own before it is sent
+        assert len(slots) > len(gets)
+        gets.append(url)
+        return FakeResponse('<title>The Film - Official Trailer</title>')
+
+    monkeypatch.setattr(enricher.session, 'get', fake_get)
+    monkeypatch.setattr(
+        enricher, '_load_cached_candidates',
+        lambda query: [('abc', None), ('def', None)])
+
+    trailer_url = enricher.search_youtube_trailer('The Film', '2025')
+
+    assert trailer_url == 'https://www.youtube.com/watch?v=abc'
+    assert gets
+    assert len(slots) == len(gets)
+
+
+def test_search_cache_paths_are_distinct_per_query(enricher):
+    first = enricher._search_cache_path('Film: Part 1 trailer')
+    second = enricher._search_cache_path('Film Part 1? trailer')
+
+    assert first != second
+    # Case and spacing differences still share an entry
+    assert enricher._search_cache_path('film:  PART 1 trailer') == first
+
+
+def test_long_query_is_cached(enricher):
+    query = 'A Very Long Film Title ' * 20 + '2025 trailer'
+    candidates = [('abc', 'A Very Long Film Title - Trailer')]
+
+    enricher._save_cached_candidates(query, candidates)
+
+    assert enricher._load_cached_candidates(query) == candidates